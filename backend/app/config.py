@@ -49,6 +49,7 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, description="Redis database number")
     redis_password: Optional[str] = Field(default=None, description="Redis password")
     redis_ssl: bool = Field(default=False, description="Use SSL for Redis connection")
+    redis_max_connections: int = Field(default=64, description="Redis connection pool size")
     cache_ttl: int = Field(default=300, description="Default cache TTL in seconds")
     
     # Model Paths
@@ -59,6 +60,7 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60, description="API rate limit per minute")
     rate_limit_per_hour: int = Field(default=1000, description="API rate limit per hour")
+    api_key_salt: str = Field(default="", description="Secret key for hashing API keys into rate limit identifiers")
     
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
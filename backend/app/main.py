@@ -20,6 +20,7 @@ from app.config import settings
 from app.utils.logging import logger, RequestLogger
 from app.utils.cache import cache_manager
 from app.utils.rate_limiter import limiter, rate_limit_handler
+from app.utils.technical_indicators import warm_up_kernels
 from app.utils.exceptions import BaseAPIException
 from app.routes import stocks, crypto, commodities, predictions, analysis, websocket, history, financial
 from app.models.schemas import HealthCheckResponse, ServiceHealth, ErrorResponse, ErrorDetail
@@ -35,6 +36,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("application_starting", version=settings.app_version, environment=settings.environment)
     await cache_manager.initialize()
+    warm_up_kernels()
     logger.info("application_started")
     
     yield
@@ -242,4 +244,10 @@ app.include_router(websocket.router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=settings.is_development)
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.is_development,
+        ws_per_message_deflate=True  # Compress /ws/stocks frames when the client offers it
+    )
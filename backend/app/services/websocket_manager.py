@@ -8,9 +8,11 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Set, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import random
 
+from starlette.websockets import WebSocketState
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,20 @@ class PriceUpdate:
     low: float = 0.0
     volume: int = 0
     timestamp: str = ""
+    
+    def to_dict(self) -> Dict:
+        """Flat dict for JSON; much cheaper than dataclasses.asdict's recursive copy."""
+        return {
+            "type": self.type,
+            "symbol": self.symbol,
+            "price": self.price,
+            "change": self.change,
+            "change_percent": self.change_percent,
+            "high": self.high,
+            "low": self.low,
+            "volume": self.volume,
+            "timestamp": self.timestamp
+        }
 
 
 class WebSocketManager:
@@ -42,6 +58,24 @@ class WebSocketManager:
     MAX_SUBSCRIPTIONS_PER_CLIENT = 20
     PRICE_UPDATE_INTERVAL = 30  # seconds
     
+    # Demo base prices, built once rather than on every tick
+    _BASE_PRICES: Dict[str, float] = {
+        'RELIANCE': 2456.30,
+        'TCS': 3892.45,
+        'HDFCBANK': 1654.20,
+        'INFY': 1567.80,
+        'ICICIBANK': 1023.45,
+        'SBIN': 628.90,
+        'BHARTIARTL': 1245.60,
+        'ITC': 456.75,
+        'KOTAKBANK': 1789.50,
+        'LT': 2345.60,
+        'WIPRO': 485.20,
+        'TATAMOTORS': 987.60,
+        'ADANIENT': 2856.45,
+        'SUNPHARMA': 1234.80,
+    }
+    
     def __init__(self):
         # client_id -> websocket
         self.active_connections: Dict[str, any] = {}
@@ -55,6 +89,9 @@ class WebSocketManager:
         # Cache for latest prices
         self.price_cache: Dict[str, PriceUpdate] = {}
         
+        # Stable random base prices for symbols not in _BASE_PRICES
+        self._unknown_prices: Dict[str, float] = {}
+        
         # Task for price streaming
         self._stream_task: Optional[asyncio.Task] = None
         
@@ -90,8 +127,7 @@ class WebSocketManager:
         # Remove from all symbol subscriptions
         if client_id in self.subscriptions:
             for symbol in self.subscriptions[client_id]:
-                if symbol in self.symbol_subscribers:
-                    self.symbol_subscribers[symbol].discard(client_id)
+                self._remove_subscriber(symbol, client_id)
             
             del self.subscriptions[client_id]
         
@@ -115,31 +151,28 @@ class WebSocketManager:
         if client_id not in self.subscriptions:
             return {"success": False, "error": "Client not connected"}
         
-        # Validate symbols count
-        current_count = len(self.subscriptions[client_id])
-        new_symbols = [s.upper() for s in symbols if s.upper() not in self.subscriptions[client_id]]
+        # Canonicalize once at ingress; everything downstream assumes uppercase.
+        # Dedupe in request order so the reply echoes symbols as asked
+        incoming = dict.fromkeys(s.upper() for s in symbols)
+        existing = self.subscriptions[client_id]
+        new_symbols = incoming.keys() - existing
         
-        if current_count + len(new_symbols) > self.MAX_SUBSCRIPTIONS_PER_CLIENT:
+        # Validate symbols count
+        if len(existing) + len(new_symbols) > self.MAX_SUBSCRIPTIONS_PER_CLIENT:
             return {
                 "success": False,
                 "error": f"Maximum {self.MAX_SUBSCRIPTIONS_PER_CLIENT} subscriptions allowed"
             }
         
         # Add subscriptions
-        subscribed = []
-        for symbol in new_symbols:
-            symbol = symbol.upper()
-            self.subscriptions[client_id].add(symbol)
-            
-            if symbol not in self.symbol_subscribers:
-                self.symbol_subscribers[symbol] = set()
-            self.symbol_subscribers[symbol].add(client_id)
-            
-            subscribed.append(symbol)
+        existing |= new_symbols
+        subscribed = [s for s in incoming if s in new_symbols]
+        for symbol in subscribed:
+            self.symbol_subscribers.setdefault(symbol, set()).add(client_id)
             
             # Send current price if cached
             if symbol in self.price_cache:
-                await self.send_to_client(client_id, asdict(self.price_cache[symbol]))
+                await self.send_to_client(client_id, self.price_cache[symbol].to_dict())
         
         logger.info(f"Client {client_id} subscribed to: {subscribed}")
         
@@ -167,9 +200,7 @@ class WebSocketManager:
             if symbol in self.subscriptions[client_id]:
                 self.subscriptions[client_id].discard(symbol)
                 
-                if symbol in self.symbol_subscribers:
-                    self.symbol_subscribers[symbol].discard(client_id)
-                
+                self._remove_subscriber(symbol, client_id)
                 unsubscribed.append(symbol)
         
         return {
@@ -178,15 +209,30 @@ class WebSocketManager:
             "total_subscriptions": len(self.subscriptions[client_id])
         }
     
+    def _remove_subscriber(self, symbol: str, client_id: str):
+        """Drop client from a symbol's subscribers, pruning the symbol once empty."""
+        subscribers = self.symbol_subscribers.get(symbol)
+        if subscribers is None:
+            return
+        subscribers.discard(client_id)
+        if not subscribers:
+            self._prune_symbol(symbol)
+    
+    def _prune_symbol(self, symbol: str):
+        """Forget a symbol that has lost its last subscriber."""
+        del self.symbol_subscribers[symbol]
+        # Clients can subscribe to arbitrary strings, so don't keep their demo prices
+        self._unknown_prices.pop(symbol, None)
+    
     async def broadcast_price_update(self, symbol: str, price_data: Dict):
         """
         Broadcast price update to all subscribers.
         
         Args:
-            symbol: Stock symbol
+            symbol: Stock symbol (already canonical uppercase)
             price_data: Price information
         """
-        symbol = symbol.upper()
+        assert symbol == symbol.upper(), f"non-canonical symbol: {symbol}"
         
         if symbol not in self.symbol_subscribers:
             return
@@ -207,20 +253,54 @@ class WebSocketManager:
         # Cache the update
         self.price_cache[symbol] = update
         
-        # Send to all subscribers
-        message = asdict(update)
-        disconnected = []
+        # Send to a snapshot of subscribers concurrently so one slow client can't
+        # stall the rest, and disconnects during the fanout can't mutate the set
+        message = update.to_dict()
+        subscribers = tuple(self.symbol_subscribers[symbol])
+        results = await asyncio.gather(
+            *(self.send_to_client(client_id, message) for client_id in subscribers),
+            return_exceptions=True
+        )
         
-        for client_id in self.symbol_subscribers[symbol]:
-            try:
-                await self.send_to_client(client_id, message)
-            except Exception as e:
-                logger.warning(f"Failed to send to {client_id}: {e}")
-                disconnected.append(client_id)
+        dead = {
+            client_id for client_id, result in zip(subscribers, results)
+            if isinstance(result, Exception)
+        }
+        if dead:
+            self._drop_failed_subscribers(symbol, dead)
+    
+    def _drop_failed_subscribers(self, symbol: str, dead: Set[str]):
+        """
+        Unsubscribe clients whose send failed from a single symbol.
         
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            self.disconnect(client_id)
+        Only connections that are actually closed are fully disconnected here;
+        others are left to the route's receive loop, which calls disconnect()
+        once the socket reports WebSocketDisconnect.
+        """
+        logger.warning(f"Failed to send {symbol} to {len(dead)} client(s)")
+        
+        subscribers = self.symbol_subscribers.get(symbol)
+        if subscribers is not None:
+            subscribers -= dead
+            if not subscribers:
+                self._prune_symbol(symbol)
+        
+        for client_id in dead:
+            client_symbols = self.subscriptions.get(client_id)
+            if client_symbols is not None:
+                client_symbols.discard(symbol)
+            
+            websocket = self.active_connections.get(client_id)
+            if websocket is None or self._is_closed(websocket):
+                self.disconnect(client_id)
+    
+    @staticmethod
+    def _is_closed(websocket) -> bool:
+        """Check whether either side of the WebSocket has closed."""
+        return (
+            getattr(websocket, "client_state", None) == WebSocketState.DISCONNECTED
+            or getattr(websocket, "application_state", None) == WebSocketState.DISCONNECTED
+        )
     
     async def send_to_client(self, client_id: str, message: Dict):
         """Send message to specific client."""
@@ -237,19 +317,18 @@ class WebSocketManager:
         
         while True:
             try:
-                # Get all subscribed symbols
-                all_symbols = set()
-                for symbols in self.subscriptions.values():
-                    all_symbols.update(symbols)
+                # Symbols with at least one subscriber (empty sets are pruned)
+                all_symbols = list(self.symbol_subscribers.keys())
                 
                 # Generate mock price updates
                 # In production: fetch from Yahoo Finance, data provider, etc.
+                updates = {}
                 for symbol in all_symbols:
                     # Demo price (would be real data in production)
                     base_price = self._get_base_price(symbol)
                     change = (random.random() - 0.5) * base_price * 0.01
                     
-                    price_data = {
+                    updates[symbol] = {
                         'price': base_price + change,
                         'change': change,
                         'change_percent': (change / base_price) * 100,
@@ -257,8 +336,15 @@ class WebSocketManager:
                         'low': base_price * 0.98,
                         'volume': random.randint(100000, 5000000)
                     }
-                    
-                    await self.broadcast_price_update(symbol, price_data)
+                
+                # Fan out all symbols in parallel
+                results = await asyncio.gather(
+                    *(self.broadcast_price_update(symbol, data) for symbol, data in updates.items()),
+                    return_exceptions=True
+                )
+                for symbol, result in zip(updates, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Broadcast failed for {symbol}: {result}")
                 
                 # Wait before next update
                 await asyncio.sleep(self.PRICE_UPDATE_INTERVAL)
@@ -272,23 +358,13 @@ class WebSocketManager:
     
     def _get_base_price(self, symbol: str) -> float:
         """Get base price for a symbol (demo data)."""
-        prices = {
-            'RELIANCE': 2456.30,
-            'TCS': 3892.45,
-            'HDFCBANK': 1654.20,
-            'INFY': 1567.80,
-            'ICICIBANK': 1023.45,
-            'SBIN': 628.90,
-            'BHARTIARTL': 1245.60,
-            'ITC': 456.75,
-            'KOTAKBANK': 1789.50,
-            'LT': 2345.60,
-            'WIPRO': 485.20,
-            'TATAMOTORS': 987.60,
-            'ADANIENT': 2856.45,
-            'SUNPHARMA': 1234.80,
-        }
-        return prices.get(symbol, 1000 + random.random() * 1500)
+        price = self._BASE_PRICES.get(symbol)
+        if price is None:
+            price = self._unknown_prices.get(symbol)
+            if price is None:
+                # Pin a random base once so `change` stays meaningful across ticks
+                price = self._unknown_prices[symbol] = 1000 + random.random() * 1500
+        return price
     
     async def handle_message(self, client_id: str, message: Dict):
         """
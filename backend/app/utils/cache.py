@@ -4,13 +4,16 @@ Caching Module - Redis-based caching with in-memory fallback.
 
 import json
 import hashlib
-from datetime import datetime, timedelta
-from typing import Any, Callable, Optional, TypeVar
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, TypeVar
 from functools import wraps
 import asyncio
 
 try:
     import redis.asyncio as redis
+    from redis.asyncio.retry import Retry
+    from redis.backoff import ExponentialBackoff
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -22,46 +25,59 @@ T = TypeVar('T')
 
 
 class InMemoryCache:
-    """Simple in-memory cache for development/fallback."""
+    """Simple in-memory LRU cache with per-key TTL for development/fallback."""
     
-    def __init__(self, default_ttl: int = 300):
-        self._cache: dict = {}
-        self._expiry: dict = {}
+    def __init__(self, default_ttl: int = 300, max_size: int = 10_000):
+        # key -> (value, expires_at); ordered oldest-used first
+        self._cache: OrderedDict = OrderedDict()
         self._lock = asyncio.Lock()
         self.default_ttl = default_ttl
+        self.max_size = max_size
     
     async def get(self, key: str) -> Optional[Any]:
         async with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
-            if datetime.utcnow() > self._expiry.get(key, datetime.min):
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
                 del self._cache[key]
-                del self._expiry[key]
                 return None
-            return self._cache[key]
+            self._cache.move_to_end(key)
+            return value
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         async with self._lock:
-            self._cache[key] = value
-            self._expiry[key] = datetime.utcnow() + timedelta(seconds=ttl or self.default_ttl)
+            self._cache[key] = (value, time.monotonic() + (ttl or self.default_ttl))
+            self._cache.move_to_end(key)
+            # Expired-but-unread entries age towards the front and go first
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
             return True
     
     async def delete(self, key: str) -> bool:
         async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._expiry[key]
-                return True
-            return False
+            return self._cache.pop(key, None) is not None
 
 
 class CacheManager:
     """Unified cache manager with Redis and In-Memory fallback."""
     
+    # Short-lived process-local layer in front of Redis for hot keys
+    L1_TTL = 2  # seconds
+    L1_MAX_SIZE = 1024
+    
+    # Above these sizes JSON work is moved to a thread to keep the event loop responsive
+    LARGE_VALUE_ITEMS = 1000  # top-level items in a list/dict
+    LARGE_PAYLOAD_BYTES = 64_000
+    
     def __init__(self):
         self.memory = InMemoryCache(default_ttl=settings.cache_ttl)
+        self.l1 = InMemoryCache(default_ttl=self.L1_TTL, max_size=self.L1_MAX_SIZE)
         self.redis: Optional[redis.Redis] = None
         self._redis_available = False
+        # cache_key -> task computing and caching the value for all concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     async def initialize(self) -> None:
         """Initialize the cache connection."""
@@ -70,12 +86,21 @@ class CacheManager:
             return
 
         try:
-            self.redis = redis.from_url(
+            # Blocking pool so bursts wait briefly for a free connection
+            # instead of failing once the pool is exhausted
+            pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                timeout=2,
+                health_check_interval=30,
                 encoding="utf-8",
                 decode_responses=True,
-                socket_connect_timeout=2
+                socket_connect_timeout=2,
+                socket_keepalive=True,
+                retry_on_timeout=True,
+                retry=Retry(ExponentialBackoff(), 3)
             )
+            self.redis = redis.Redis(connection_pool=pool)
             # Test connection
             await self.redis.ping()
             self._redis_available = True
@@ -86,10 +111,16 @@ class CacheManager:
     
     async def get(self, key: str) -> Optional[Any]:
         if self._redis_available and self.redis:
+            # L1 holds the encoded payload so every caller decodes its own
+            # copy, as with a Redis hit, and can mutate it freely
+            data = await self.l1.get(key)
+            if data is not None:
+                return await self._decode(data)
             try:
                 data = await self.redis.get(key)
                 if data:
-                    return json.loads(data)
+                    await self.l1.set(key, data)
+                    return await self._decode(data)
             except Exception as e:
                 logger.error("redis_get_error", key=key, error=str(e))
         
@@ -100,11 +131,9 @@ class CacheManager:
         
         if self._redis_available and self.redis:
             try:
-                await self.redis.set(
-                    key, 
-                    json.dumps(value), 
-                    ex=ttl
-                )
+                data = await self._encode(value)
+                await self.redis.set(key, data, ex=ttl)
+                await self.l1.set(key, data, min(ttl, self.L1_TTL))
                 return True
             except Exception as e:
                 logger.error("redis_set_error", key=key, error=str(e))
@@ -113,6 +142,7 @@ class CacheManager:
     
     async def delete(self, key: str) -> bool:
         if self._redis_available and self.redis:
+            await self.l1.delete(key)
             try:
                 await self.redis.delete(key)
                 return True
@@ -121,10 +151,24 @@ class CacheManager:
         
         return await self.memory.delete(key)
     
+    async def _encode(self, value: Any) -> str:
+        """JSON-encode a value, off the event loop when it is large."""
+        if isinstance(value, (list, dict)) and len(value) > self.LARGE_VALUE_ITEMS:
+            return await asyncio.to_thread(json.dumps, value)
+        return json.dumps(value)
+    
+    async def _decode(self, data: str) -> Any:
+        """JSON-decode a payload, off the event loop when it is large."""
+        if len(data) > self.LARGE_PAYLOAD_BYTES:
+            return await asyncio.to_thread(json.loads, data)
+        return json.loads(data)
+    
     def generate_key(self, prefix: str, *args, **kwargs) -> str:
-        key_data = f"{prefix}:{':'.join(str(a) for a in args)}"
+        parts = [prefix]
+        parts.extend(map(str, args))
         if kwargs:
-            key_data += f":{':'.join(f'{k}={v}' for k, v in sorted(kwargs.items()))}"
+            parts.extend([f"{k}={v}" for k, v in sorted(kwargs.items())])
+        key_data = ":".join(parts)
         if len(key_data) > 200:
             return f"{prefix}:{hashlib.md5(key_data.encode()).hexdigest()}"
         return key_data
@@ -136,15 +180,38 @@ cache_manager = CacheManager()
 def cached(prefix: str, ttl: Optional[int] = None):
     """Caching decorator for async functions."""
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        async def compute(cache_key: str, args, kwargs) -> T:
+            try:
+                result = await func(*args, **kwargs)
+                await cache_manager.set(cache_key, result, ttl)
+                return result
+            finally:
+                # Only after the write, so late arrivals hit the cache instead of recomputing
+                cache_manager._inflight.pop(cache_key, None)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             cache_key = cache_manager.generate_key(prefix, *args, **kwargs)
             cached_value = await cache_manager.get(cache_key)
             if cached_value is not None:
                 return cached_value
-            result = await func(*args, **kwargs)
-            await cache_manager.set(cache_key, result, ttl)
-            return result
+            
+            # Coalesce concurrent misses on the same key into one task
+            task = cache_manager._inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                task.add_done_callback(_consume_task_result)
+                cache_manager._inflight[cache_key] = task
+            
+            # Shielded, so cancelling any one caller (including the one that
+            # started the task) leaves the shared work running for the others
+            return await asyncio.shield(task)
         return wrapper
     decorator._is_cached = True # Mark for documentation/tracking
     return decorator
+
+
+def _consume_task_result(task: asyncio.Task) -> None:
+    """Mark a coalesced task's exception retrieved in case every caller went away."""
+    if not task.cancelled():
+        task.exception()
@@ -12,6 +12,8 @@ class BaseAPIException(Exception):
     Provides consistent error structure for API responses.
     """
     
+    __slots__ = ("message", "code", "status_code", "details", "field", "_dict")
+    
     def __init__(
         self,
         message: str,
@@ -26,18 +28,21 @@ class BaseAPIException(Exception):
         self.details = details or {}
         self.field = field
         super().__init__(self.message)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert exception to dictionary for API response."""
-        error_dict = {
+        
+        # Built once here; `details` is shared by reference so subclasses
+        # that add keys after construction are still reflected.
+        self._dict: Dict[str, Any] = {
             "code": self.code,
             "message": self.message
         }
         if self.field:
-            error_dict["field"] = self.field
+            self._dict["field"] = self.field
         if self.details:
-            error_dict["details"] = self.details
-        return error_dict
+            self._dict["details"] = self.details
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert exception to dictionary for API response."""
+        return self._dict
 
 
 # ============== 400 Bad Request Errors ==============
@@ -45,6 +50,8 @@ class BaseAPIException(Exception):
 class BadRequestException(BaseAPIException):
     """Exception for malformed or invalid requests."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Bad request",
@@ -64,6 +71,8 @@ class BadRequestException(BaseAPIException):
 class ValidationException(BaseAPIException):
     """Exception for validation errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Validation failed",
@@ -82,6 +91,8 @@ class ValidationException(BaseAPIException):
 class InvalidSymbolException(BaseAPIException):
     """Exception for invalid stock/crypto symbols."""
     
+    __slots__ = ()
+    
     def __init__(self, symbol: str, market: str = "unknown"):
         super().__init__(
             message=f"Invalid symbol '{symbol}' for market '{market}'",
@@ -97,6 +108,8 @@ class InvalidSymbolException(BaseAPIException):
 class UnauthorizedException(BaseAPIException):
     """Exception for authentication failures."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Authentication required",
@@ -113,6 +126,8 @@ class UnauthorizedException(BaseAPIException):
 class InvalidAPIKeyException(BaseAPIException):
     """Exception for invalid API key."""
     
+    __slots__ = ()
+    
     def __init__(self, service: str = "API"):
         super().__init__(
             message=f"Invalid or missing {service} API key",
@@ -127,6 +142,8 @@ class InvalidAPIKeyException(BaseAPIException):
 class ForbiddenException(BaseAPIException):
     """Exception for forbidden access."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Access forbidden",
@@ -145,6 +162,8 @@ class ForbiddenException(BaseAPIException):
 class NotFoundException(BaseAPIException):
     """Exception for resource not found."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Resource not found",
@@ -168,6 +187,8 @@ class NotFoundException(BaseAPIException):
 class StockNotFoundException(NotFoundException):
     """Exception for stock not found."""
     
+    __slots__ = ()
+    
     def __init__(self, symbol: str, exchange: str = "unknown"):
         super().__init__(
             message=f"Stock '{symbol}' not found on exchange '{exchange}'",
@@ -180,6 +201,8 @@ class StockNotFoundException(NotFoundException):
 class CryptoNotFoundException(NotFoundException):
     """Exception for cryptocurrency not found."""
     
+    __slots__ = ()
+    
     def __init__(self, symbol: str):
         super().__init__(
             message=f"Cryptocurrency '{symbol}' not found",
@@ -191,6 +214,8 @@ class CryptoNotFoundException(NotFoundException):
 class ModelNotFoundException(NotFoundException):
     """Exception for ML model not found."""
     
+    __slots__ = ()
+    
     def __init__(self, model_name: str):
         super().__init__(
             message=f"ML model '{model_name}' not found or not loaded",
@@ -204,6 +229,8 @@ class ModelNotFoundException(NotFoundException):
 class RateLimitExceededException(BaseAPIException):
     """Exception for rate limit exceeded."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -226,6 +253,8 @@ class RateLimitExceededException(BaseAPIException):
 class InternalServerException(BaseAPIException):
     """Exception for internal server errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Internal server error",
@@ -242,6 +271,8 @@ class InternalServerException(BaseAPIException):
 class DatabaseException(BaseAPIException):
     """Exception for database errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Database error occurred",
@@ -259,6 +290,8 @@ class DatabaseException(BaseAPIException):
 class CacheException(BaseAPIException):
     """Exception for cache (Redis) errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Cache error occurred",
@@ -276,6 +309,8 @@ class CacheException(BaseAPIException):
 class MLModelException(BaseAPIException):
     """Exception for ML model errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "ML model error occurred",
@@ -301,6 +336,8 @@ class MLModelException(BaseAPIException):
 class ExternalServiceException(BaseAPIException):
     """Exception for external service failures."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         service_name: str,
@@ -318,6 +355,8 @@ class ExternalServiceException(BaseAPIException):
 class YahooFinanceException(ExternalServiceException):
     """Exception for Yahoo Finance API errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Failed to fetch data from Yahoo Finance"):
         super().__init__(
             service_name="Yahoo Finance",
@@ -329,6 +368,8 @@ class YahooFinanceException(ExternalServiceException):
 class CoinGeckoException(ExternalServiceException):
     """Exception for CoinGecko API errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Failed to fetch data from CoinGecko"):
         super().__init__(
             service_name="CoinGecko",
@@ -340,6 +381,8 @@ class CoinGeckoException(ExternalServiceException):
 class MetalsAPIException(ExternalServiceException):
     """Exception for Metals API errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Failed to fetch data from Metals API"):
         super().__init__(
             service_name="Metals API",
@@ -351,6 +394,8 @@ class MetalsAPIException(ExternalServiceException):
 class ServiceUnavailableException(BaseAPIException):
     """Exception for service unavailable."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Service temporarily unavailable",
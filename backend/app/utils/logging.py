@@ -3,52 +3,193 @@ Structured Logging Module
 Provides JSON-formatted logging with timestamps and request context.
 """
 
+import atexit
+import io
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 import structlog
 from functools import lru_cache
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from app.config import settings
 
 
+# (millisecond, formatted timestamp) of the last log event; a single tuple so
+# concurrent writers can never pair a millisecond with another's string
+_last_timestamp = (0, "")
+
+
 def add_timestamp(
     logger: logging.Logger, 
     method_name: str, 
     event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Add ISO timestamp to log events."""
-    event_dict["timestamp"] = datetime.utcnow().isoformat() + "Z"
+    """Add ISO timestamp (millisecond precision) to log events."""
+    global _last_timestamp
+    now_ms = time.time_ns() // 1_000_000
+    last_ms, timestamp = _last_timestamp
+    if now_ms != last_ms:
+        timestamp = datetime.utcfromtimestamp(now_ms / 1000).isoformat(timespec="milliseconds") + "Z"
+        _last_timestamp = (now_ms, timestamp)
+    event_dict["timestamp"] = timestamp
     return event_dict
 
 
+# Settings are fixed for the life of the process, so build the context once
+_APP_CONTEXT: Dict[str, Any] = {
+    "app_name": settings.app_name,
+    "environment": settings.environment,
+    "version": settings.app_version,
+}
+
+
 def add_app_context(
     logger: logging.Logger, 
     method_name: str, 
     event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Add application context to log events."""
-    event_dict["app_name"] = settings.app_name
-    event_dict["environment"] = settings.environment
-    event_dict["version"] = settings.app_version
+    event_dict.update(_APP_CONTEXT)
     return event_dict
 
 
+# Background thread draining queued records to stdout (see configure_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+LOG_BUFFER_SIZE = 65536
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that flushes once per burst instead of once per record.
+    
+    Runs on the QueueListener thread: lines accumulate in the stream buffer
+    while more records are queued and are flushed when the queue drains or a
+    WARNING+ record arrives, so one write() syscall covers many JSON lines.
+    """
+    
+    def __init__(self, stream, log_queue: queue.SimpleQueue):
+        super().__init__(stream)
+        self._queue = log_queue
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING or self._queue.empty():
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _open_log_stream():
+    """64 KB buffered text stream on stdout's fd (falls back to sys.stdout)."""
+    try:
+        raw = io.FileIO(sys.stdout.fileno(), "w", closefd=False)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return sys.stdout
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=LOG_BUFFER_SIZE),
+        encoding="utf-8",
+        write_through=False,
+        line_buffering=False,
+    )
+
+
+def _shutdown_logging() -> None:
+    """Drain the log queue and flush buffered output at interpreter exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+
+
+def _restart_log_listener() -> None:
+    """Restart the listener thread in a forked worker (threads don't survive fork)."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener = logging.handlers.QueueListener(
+            _log_listener.queue,
+            *_log_listener.handlers,
+            respect_handler_level=_log_listener.respect_handler_level,
+        )
+        _log_listener.start()
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if ORJSON_AVAILABLE else 0
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """orjson-backed serializer for JSONRenderer (stdlib logging expects str)."""
+    try:
+        # NumPy scalars and arrays log as numbers/lists, as they would via json
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits without consulting
+        # default; json writes them as plain numbers
+        def fallback(value: Any) -> Any:
+            # NumPy scalars/arrays still become numbers/lists on this path
+            tolist = getattr(value, "tolist", None)
+            if tolist is not None:
+                return tolist()
+            if default is None:
+                raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+            return default(value)
+        
+        return json.dumps(obj, default=fallback, **kwargs)
+
+
 def configure_logging() -> None:
     """
     Configure structured logging for the application.
     Sets up both structlog and standard library logging.
+    
+    Runs once per process: re-importing this module (reload, per-worker
+    import) must not swap the processor chain and drop the loggers that
+    cache_logger_on_first_use has already cached.
     """
+    if structlog.is_configured():
+        return
+    
     # Determine log level
     log_level = getattr(logging, settings.log_level, logging.INFO)
     
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
-    )
+    # Configure standard library logging. Records are handed to a queue and
+    # written to a buffered stdout by a background listener thread, so request
+    # handlers never block on the write itself.
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    if not root.handlers:
+        global _log_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        stream_handler = _BatchingStreamHandler(_open_log_stream(), log_queue)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener.start()
+        atexit.register(_shutdown_logging)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_restart_log_listener)
+    
+    # Nothing renders caller file/line, pids or thread names (format is just
+    # "%(message)s"), so skip the frame walk and lookups LogRecord does per call
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Shared processors for both dev and prod
     shared_processors = [
@@ -66,7 +207,9 @@ def configure_logging() -> None:
         # Production: JSON format
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if ORJSON_AVAILABLE else json.dumps
+            )
         ]
     else:
         # Development: Console format with colors
@@ -103,6 +246,8 @@ class RequestLogger:
     Provides structured logging for API requests.
     """
     
+    _LOG = get_logger("request")
+    
     def __init__(
         self,
         request_id: str,
@@ -110,61 +255,59 @@ class RequestLogger:
         path: str,
         client_ip: Optional[str] = None
     ):
-        self.logger = get_logger("request")
+        # Request context is bound once and carried by every event below
+        self.logger = self._LOG.bind(
+            request_id=request_id,
+            method=method,
+            path=path,
+            client_ip=client_ip
+        )
+        self._enabled_for = self.logger.isEnabledFor
         self.request_id = request_id
         self.method = method
         self.path = path
         self.client_ip = client_ip
-        self.start_time: Optional[datetime] = None
+        self._t0_ns = 0
     
     def __enter__(self) -> "RequestLogger":
         """Log request start."""
-        self.start_time = datetime.utcnow()
-        self.logger.info(
-            "request_started",
-            request_id=self.request_id,
-            method=self.method,
-            path=self.path,
-            client_ip=self.client_ip
-        )
+        self._t0_ns = time.perf_counter_ns()
+        self.logger.info("request_started")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Log request completion."""
         duration_ms = None
-        if self.start_time:
-            duration_ms = (datetime.utcnow() - self.start_time).total_seconds() * 1000
+        if self._t0_ns:
+            duration_ms = (time.perf_counter_ns() - self._t0_ns) / 1e6
         
         if exc_type:
             self.logger.error(
                 "request_failed",
-                request_id=self.request_id,
-                method=self.method,
-                path=self.path,
                 duration_ms=duration_ms,
                 error_type=exc_type.__name__ if exc_type else None,
                 error_message=str(exc_val) if exc_val else None
             )
         else:
-            self.logger.info(
-                "request_completed",
-                request_id=self.request_id,
-                method=self.method,
-                path=self.path,
-                duration_ms=duration_ms
-            )
+            self.logger.info("request_completed", duration_ms=duration_ms)
     
     def log_info(self, message: str, **kwargs) -> None:
         """Log info message with request context."""
-        self.logger.info(message, request_id=self.request_id, **kwargs)
+        if not self._enabled_for(logging.INFO):
+            return
+        self.logger.info(message, **kwargs)
     
     def log_warning(self, message: str, **kwargs) -> None:
         """Log warning message with request context."""
-        self.logger.warning(message, request_id=self.request_id, **kwargs)
+        if not self._enabled_for(logging.WARNING):
+            return
+        self.logger.warning(message, **kwargs)
     
     def log_error(self, message: str, **kwargs) -> None:
         """Log error message with request context."""
-        self.logger.error(message, request_id=self.request_id, **kwargs)
+        if not self._enabled_for(logging.ERROR):
+            return
+        self.logger.error(message, **kwargs)
 
 
 # Initialize logging on module load
@@ -4,12 +4,21 @@ Comprehensive utilities for Indian stock market analysis.
 Includes market hours, holidays, and performance calculations.
 """
 
+import math
+import time
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time as time_of_day
 from typing import Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 # NSE Market Holidays 2026 (Official List)
@@ -34,6 +43,9 @@ NSE_HOLIDAYS_2026 = [
     date(2026, 12, 25),  # Christmas
 ]
 
+# Hashed view of the holiday list for O(1) membership checks
+NSE_HOLIDAYS_2026_SET = frozenset(NSE_HOLIDAYS_2026)
+
 # Top 50 NSE Stocks by Market Cap
 TOP_NSE_STOCKS = [
     {"symbol": "RELIANCE", "name": "Reliance Industries Ltd.", "sector": "Oil & Gas"},
@@ -89,9 +101,100 @@ TOP_NSE_STOCKS = [
 ]
 
 
-@dataclass
+def _to_float_array(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """float64 view of a Series/array/list with NaNs dropped, without building a Series."""
+    if isinstance(values, pd.Series):
+        arr = values.to_numpy(dtype=np.float64, copy=False)
+    else:
+        arr = np.asarray(values, dtype=np.float64)
+    return arr[~np.isnan(arr)]
+
+
+# Uppercased search keys, parallel to TOP_NSE_STOCKS, built once
+_SYMBOLS_UP = tuple(stock['symbol'].upper() for stock in TOP_NSE_STOCKS)
+_NAMES_UP = tuple(stock['name'].upper() for stock in TOP_NSE_STOCKS)
+
+
+# Exact-symbol index for ticker lookups
+_SYMBOL_INDEX = {symbol: i for i, symbol in enumerate(_SYMBOLS_UP)}
+
+
+@lru_cache(maxsize=256)
+def _search_stock_indices(query: str, limit: int) -> Tuple[int, ...]:
+    """
+    Indices into TOP_NSE_STOCKS matching query (uppercase).
+    
+    An exact symbol hit returns just that stock; otherwise symbols and
+    names are scanned for the substring, in market-cap order.
+    """
+    if limit <= 0:
+        return ()
+    
+    exact = _SYMBOL_INDEX.get(query)
+    if exact is not None:
+        return (exact,)
+    
+    matches = []
+    for i, (symbol, name) in enumerate(zip(_SYMBOLS_UP, _NAMES_UP)):
+        if query in symbol or query in name:
+            matches.append(i)
+            if len(matches) >= limit:
+                break
+    return tuple(matches)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _max_drawdown_kernel(arr):
+        """Single-pass max drawdown: returns (drawdown %, peak index, trough index)."""
+        # Indices default to the first valid price, as in the NumPy path
+        start = 0
+        while start < arr.size and np.isnan(arr[start]):
+            start += 1
+        if start == arr.size:
+            return np.nan, 0, 0
+        running = -np.inf
+        peak_i = start
+        best_dd = 0.0
+        best_peak = start
+        best_trough = start
+        for i in range(start, arr.size):
+            x = arr[i]
+            if np.isnan(x):
+                continue
+            if x > running:
+                running = x
+                peak_i = i
+            dd = (x - running) / running
+            if dd < best_dd:
+                best_dd = dd
+                best_trough = i
+                best_peak = peak_i
+        return best_dd * 100.0, best_peak, best_trough
+
+
+@lru_cache(maxsize=512)
+def _next_trading_day_after(from_date: date, exclude_holidays: bool) -> date:
+    """Next weekday after from_date, optionally skipping NSE holidays (memoized)."""
+    next_day = from_date + timedelta(days=1)
+    
+    while True:
+        # Skip weekends
+        if next_day.weekday() >= 5:
+            next_day += timedelta(days=1)
+            continue
+        
+        # Skip holidays
+        if exclude_holidays and next_day in NSE_HOLIDAYS_2026_SET:
+            next_day += timedelta(days=1)
+            continue
+        
+        return next_day
+
+
+@dataclass(frozen=True, slots=True)
 class MarketStatus:
-    """Market status information."""
+    """Market status information (immutable, so cached instances can be shared)."""
     status: str  # "pre_market", "open", "closed", "post_market"
     is_trading: bool
     message: str
@@ -109,6 +212,26 @@ class MarketUtils:
     MARKET_CLOSE = (15, 30)  # 3:30 PM IST
     PRE_MARKET_START = (9, 0)   # 9:00 AM
     POST_MARKET_END = (16, 0)   # 4:00 PM
+    
+    # Trading hours as seconds since midnight, for allocation-free comparisons
+    MARKET_OPEN_S = MARKET_OPEN[0] * 3600 + MARKET_OPEN[1] * 60
+    MARKET_CLOSE_S = MARKET_CLOSE[0] * 3600 + MARKET_CLOSE[1] * 60
+    PRE_MARKET_START_S = PRE_MARKET_START[0] * 3600 + PRE_MARKET_START[1] * 60
+    POST_MARKET_END_S = POST_MARKET_END[0] * 3600 + POST_MARKET_END[1] * 60
+    
+    # (time.time_ns() when taken, IST datetime) reused for up to 500 ms
+    _NOW_TTL_NS = 500_000_000
+    _now_cache: Tuple[int, Optional[datetime]] = (0, None)
+
+    @classmethod
+    def _now_ist(cls) -> datetime:
+        """Current IST time, reused across calls within the same ~500 ms."""
+        now_ns = time.time_ns()
+        cached_ns, cached_now = cls._now_cache
+        if cached_now is None or now_ns - cached_ns >= cls._NOW_TTL_NS:
+            cached_now = datetime.now(cls.IST)
+            cls._now_cache = (now_ns, cached_now)
+        return cached_now
 
     @classmethod
     def is_market_open(cls, timezone: str = "Asia/Kolkata") -> bool:
@@ -127,21 +250,25 @@ class MarketUtils:
             >>> MarketUtils.is_market_open()
             True  # During trading hours on weekdays
         """
-        now = datetime.now(cls.IST)
+        # Status only changes on minute boundaries; recompute at most once a second
+        return _cached_is_market_open(int(time.time()))
+
+    @classmethod
+    def _compute_is_market_open(cls) -> bool:
+        """Uncached body of is_market_open."""
+        now = cls._now_ist()
         
         # Check if it's a weekend
         if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
             return False
         
         # Check if it's a holiday
-        if now.date() in NSE_HOLIDAYS_2026:
+        if now.date() in NSE_HOLIDAYS_2026_SET:
             return False
         
         # Check time
-        market_open = now.replace(hour=9, minute=15, second=0, microsecond=0)
-        market_close = now.replace(hour=15, minute=30, second=0, microsecond=0)
-        
-        return market_open <= now <= market_close
+        seconds = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        return cls.MARKET_OPEN_S <= seconds <= cls.MARKET_CLOSE_S
 
     @classmethod
     def get_market_status(cls) -> MarketStatus:
@@ -156,78 +283,88 @@ class MarketUtils:
             >>> print(status.status, status.message)
             "open" "Market is currently trading"
         """
-        now = datetime.now(cls.IST)
+        return _cached_market_status(int(time.time()))
+
+    @classmethod
+    def _compute_market_status(cls) -> MarketStatus:
+        """Uncached body of get_market_status."""
+        now = cls._now_ist()
         today = now.date()
         
-        # Define time boundaries
-        pre_market_start = now.replace(hour=9, minute=0, second=0, microsecond=0)
-        market_open = now.replace(hour=9, minute=15, second=0, microsecond=0)
-        market_close = now.replace(hour=15, minute=30, second=0, microsecond=0)
-        post_market_end = now.replace(hour=16, minute=0, second=0, microsecond=0)
-        
         # Check weekend
         if now.weekday() >= 5:
-            next_trading = cls.get_next_trading_day()
             return MarketStatus(
                 status="closed",
                 is_trading=False,
                 message="Market closed for weekend",
-                next_open=datetime.combine(next_trading, datetime.min.time().replace(hour=9, minute=15), tzinfo=cls.IST),
+                next_open=cls._session_open(cls.get_next_trading_day(today)),
                 next_close=None
             )
         
         # Check holiday
-        if today in NSE_HOLIDAYS_2026:
-            next_trading = cls.get_next_trading_day()
+        if today in NSE_HOLIDAYS_2026_SET:
             return MarketStatus(
                 status="closed",
                 is_trading=False,
                 message="Market closed for holiday",
-                next_open=datetime.combine(next_trading, datetime.min.time().replace(hour=9, minute=15), tzinfo=cls.IST),
+                next_open=cls._session_open(cls.get_next_trading_day(today)),
                 next_close=None
             )
         
+        # Compare seconds since midnight against the session boundaries;
+        # datetimes are only built for the branch that returns them
+        seconds = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        
         # Pre-market session
-        if pre_market_start <= now < market_open:
+        if cls.PRE_MARKET_START_S <= seconds < cls.MARKET_OPEN_S:
             return MarketStatus(
                 status="pre_market",
                 is_trading=False,
                 message="Pre-market session - Trading opens shortly",
-                next_open=market_open,
-                next_close=market_close
+                next_open=cls._session_open(today),
+                next_close=cls._session_close(today)
             )
         
         # Market open
-        if market_open <= now <= market_close:
+        if cls.MARKET_OPEN_S <= seconds <= cls.MARKET_CLOSE_S:
             return MarketStatus(
                 status="open",
                 is_trading=True,
                 message="Market is currently trading",
                 next_open=None,
-                next_close=market_close
+                next_close=cls._session_close(today)
             )
         
         # Post-market session
-        if market_close < now <= post_market_end:
-            next_trading = cls.get_next_trading_day()
+        if cls.MARKET_CLOSE_S < seconds <= cls.POST_MARKET_END_S:
             return MarketStatus(
                 status="post_market",
                 is_trading=False,
                 message="Post-market session - Trading closed for today",
-                next_open=datetime.combine(next_trading, datetime.min.time().replace(hour=9, minute=15), tzinfo=cls.IST),
+                next_open=cls._session_open(cls.get_next_trading_day(today)),
                 next_close=None
             )
         
         # Closed
-        next_trading = cls.get_next_trading_day() if now.hour >= 16 else today
+        next_trading = cls.get_next_trading_day(today) if seconds > cls.POST_MARKET_END_S else today
         return MarketStatus(
             status="closed",
             is_trading=False,
             message="Market closed",
-            next_open=datetime.combine(next_trading, datetime.min.time().replace(hour=9, minute=15), tzinfo=cls.IST),
+            next_open=cls._session_open(next_trading),
             next_close=None
         )
 
+    @classmethod
+    def _session_open(cls, day: date) -> datetime:
+        """Market open time (IST) on the given day."""
+        return datetime.combine(day, time_of_day(*cls.MARKET_OPEN), tzinfo=cls.IST)
+
+    @classmethod
+    def _session_close(cls, day: date) -> datetime:
+        """Market close time (IST) on the given day."""
+        return datetime.combine(day, time_of_day(*cls.MARKET_CLOSE), tzinfo=cls.IST)
+
     @classmethod
     def get_next_trading_day(cls, from_date: Optional[date] = None, exclude_holidays: bool = True) -> date:
         """
@@ -245,28 +382,18 @@ class MarketUtils:
             datetime.date(2026, 1, 19)  # Next Monday if today is Friday
         """
         if from_date is None:
-            from_date = datetime.now(cls.IST).date()
+            from_date = cls._now_ist().date()
         
-        next_day = from_date + timedelta(days=1)
-        
-        while True:
-            # Skip weekends
-            if next_day.weekday() >= 5:
-                next_day += timedelta(days=1)
-                continue
-            
-            # Skip holidays
-            if exclude_holidays and next_day in NSE_HOLIDAYS_2026:
-                next_day += timedelta(days=1)
-                continue
-            
-            return next_day
+        return _next_trading_day_after(from_date, exclude_holidays)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def indian_market_holidays_2026() -> List[Dict[str, Union[str, date]]]:
         """
         Get list of NSE holidays for 2026.
         
+        The list is built once and shared between callers; treat it as read-only.
+        
         Returns:
             List of holidays with date and name
         """
@@ -313,21 +440,20 @@ class MarketUtils:
             >>> returns = MarketUtils.calculate_returns(df['close'], [1, 7, 30])
             {'1d': 0.52, '7d': 2.15, '30d': -1.23}
         """
-        prices = pd.Series(prices)
-        current_price = prices.iloc[-1]
-        
-        result = {}
+        arr = np.asarray(prices, dtype=np.float64)
+        p = np.asarray(periods, dtype=np.intp)
         period_names = {1: '1d', 7: '7d', 30: '30d', 90: '90d', 365: '1y'}
         
-        for period in periods:
-            if len(prices) > period:
-                past_price = prices.iloc[-period - 1]
-                ret = ((current_price - past_price) / past_price) * 100
-                name = period_names.get(period, f'{period}d')
-                result[name] = round(ret, 2)
-            else:
-                name = period_names.get(period, f'{period}d')
-                result[name] = None
+        # Gather all past prices in one indexing op instead of one .iloc per period
+        available = p < arr.size
+        past = arr[-p[available] - 1]
+        rets = np.round((arr[-1] - past) / past * 100, 2).tolist()
+        
+        result = {}
+        ret_iter = iter(rets)
+        for period, ok in zip(periods, available.tolist()):
+            name = period_names.get(period, f'{period}d')
+            result[name] = next(ret_iter) if ok else None
         
         return result
 
@@ -355,20 +481,26 @@ class MarketUtils:
             >>> sharpe = MarketUtils.calculate_sharpe_ratio(daily_returns)
             1.45  # Good risk-adjusted returns
         """
-        returns = pd.Series(returns).dropna()
+        a = _to_float_array(returns)
+        n = a.size
         
-        if len(returns) < 2:
+        if n < 2:
             return 0.0
         
+        # Mean and sample std from one sum / sum-of-squares pass
+        mean = a.sum() / n
+        var = (np.dot(a, a) / n - mean * mean) * n / (n - 1)
+        std = math.sqrt(var) if var > 0 else 0.0
+        
         # Annualize returns and std dev
-        mean_return = returns.mean() * periods_per_year
-        std_return = returns.std() * np.sqrt(periods_per_year)
+        mean_return = mean * periods_per_year
+        std_return = std * math.sqrt(periods_per_year)
         
         if std_return == 0:
             return 0.0
         
         sharpe = (mean_return - risk_free_rate) / std_return
-        return round(sharpe, 2)
+        return round(float(sharpe), 2)
 
     @staticmethod
     def calculate_max_drawdown(prices: Union[pd.Series, np.ndarray]) -> Dict[str, Union[float, int]]:
@@ -385,25 +517,33 @@ class MarketUtils:
             >>> mdd = MarketUtils.calculate_max_drawdown(df['close'])
             {'max_drawdown': -15.3, 'peak_idx': 45, 'trough_idx': 78}
         """
-        prices = pd.Series(prices)
+        arr = np.ascontiguousarray(prices, dtype=np.float64)
         
-        # Calculate running maximum
-        running_max = prices.expanding().max()
+        if NUMBA_AVAILABLE and arr.size:
+            max_dd, peak_idx, trough_idx = _max_drawdown_kernel(arr)
+            return {
+                'max_drawdown': round(float(max_dd), 2),
+                'peak_idx': int(peak_idx),
+                'trough_idx': int(trough_idx)
+            }
         
-        # Calculate drawdown
-        drawdown = (prices - running_max) / running_max * 100
+        if arr.size and np.isnan(arr).all():
+            return {'max_drawdown': np.nan, 'peak_idx': 0, 'trough_idx': 0}
         
-        # Find max drawdown
-        max_dd = drawdown.min()
-        trough_idx = drawdown.idxmin() if isinstance(drawdown.idxmin(), int) else drawdown.values.argmin()
+        # Running maximum (fmax skips NaN gaps like pandas' expanding().max())
+        running_max = np.fmax.accumulate(arr)
         
-        # Find the peak before the trough
-        peak_idx = prices.iloc[:trough_idx + 1].idxmax() if isinstance(prices.iloc[:trough_idx + 1].idxmax(), int) else prices.iloc[:trough_idx + 1].values.argmax()
+        # Drawdown and its deepest point (positional)
+        drawdown = (arr - running_max) / running_max * 100
+        trough_idx = int(np.nanargmin(drawdown))
+        
+        # The peak is the highest price up to the trough
+        peak_idx = int(np.nanargmax(arr[:trough_idx + 1]))
         
         return {
-            'max_drawdown': round(max_dd, 2),
-            'peak_idx': int(peak_idx),
-            'trough_idx': int(trough_idx)
+            'max_drawdown': round(float(drawdown[trough_idx]), 2),
+            'peak_idx': peak_idx,
+            'trough_idx': trough_idx
         }
 
     @staticmethod
@@ -432,26 +572,27 @@ class MarketUtils:
             >>> beta = MarketUtils.beta_calculation(stock_ret, nifty_ret)
             1.25  # Stock is 25% more volatile than Nifty
         """
-        stock_returns = pd.Series(stock_returns).dropna()
-        market_returns = pd.Series(market_returns).dropna()
+        stock_returns = _to_float_array(stock_returns)
+        market_returns = _to_float_array(market_returns)
         
-        # Align the series
-        min_len = min(len(stock_returns), len(market_returns))
-        stock_returns = stock_returns.iloc[-min_len:]
-        market_returns = market_returns.iloc[-min_len:]
+        # Align the series (most recent observations, by position)
+        min_len = min(stock_returns.size, market_returns.size)
+        stock_returns = stock_returns[stock_returns.size - min_len:]
+        market_returns = market_returns[market_returns.size - min_len:]
         
-        if len(stock_returns) < 10:
+        if min_len < 10:
             return 1.0
         
-        # Calculate covariance and variance
-        covariance = stock_returns.cov(market_returns)
-        market_variance = market_returns.var()
+        # Calculate covariance and variance (sample, ddof=1)
+        market_dev = market_returns - market_returns.mean()
+        covariance = np.dot(stock_returns - stock_returns.mean(), market_dev) / (min_len - 1)
+        market_variance = np.dot(market_dev, market_dev) / (min_len - 1)
         
         if market_variance == 0:
             return 1.0
         
         beta = covariance / market_variance
-        return round(beta, 2)
+        return round(float(beta), 2)
 
     @staticmethod
     def calculate_volatility(
@@ -470,17 +611,21 @@ class MarketUtils:
         Returns:
             float: Volatility as a percentage
         """
-        returns = pd.Series(prices).pct_change().dropna()
+        prices = _to_float_array(prices)
+        returns = np.diff(prices) / prices[:-1]
+        
+        if returns.size < period:
+            period = returns.size
         
-        if len(returns) < period:
-            period = len(returns)
+        if period < 2:
+            return 0.0
         
-        volatility = returns.iloc[-period:].std()
+        volatility = returns[-period:].std(ddof=1)
         
         if annualize:
             volatility *= np.sqrt(252)
         
-        return round(volatility * 100, 2)
+        return round(float(volatility) * 100, 2)
 
     @staticmethod
     def get_top_stocks(limit: int = 50) -> List[Dict]:
@@ -499,16 +644,19 @@ class MarketUtils:
         Returns:
             List of matching stocks
         """
-        query = query.upper()
-        results = []
-        
-        for stock in TOP_NSE_STOCKS:
-            if query in stock['symbol'].upper() or query in stock['name'].upper():
-                results.append(stock)
-                if len(results) >= limit:
-                    break
-        
-        return results
+        return [TOP_NSE_STOCKS[i] for i in _search_stock_indices(query.upper(), limit)]
+
+
+@lru_cache(maxsize=4)
+def _cached_is_market_open(ttl_hash: int) -> bool:
+    """is_market_open memoized per ttl_hash (whole seconds since the epoch)."""
+    return MarketUtils._compute_is_market_open()
+
+
+@lru_cache(maxsize=4)
+def _cached_market_status(ttl_hash: int) -> MarketStatus:
+    """get_market_status memoized per ttl_hash (whole seconds since the epoch)."""
+    return MarketUtils._compute_market_status()
 
 
 # Convenience functions
@@ -3,22 +3,60 @@ Rate Limiting Module
 Provides rate limiting functionality using slowapi with Redis backend support.
 """
 
-from typing import Callable, Optional
-from functools import wraps
+import hashlib
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+from functools import lru_cache, wraps
 
 from fastapi import Request, Response
+from limits import parse_many
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.wrappers import Limit
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from app.config import settings
 from app.utils.logging import logger
 
 
+# Limit strings for the decorator tiers, built once per process
+_STD_LIMIT = f"{settings.rate_limit_per_minute}/minute"
+_STRICT_LIMIT = "10/minute"
+_RELAXED_LIMIT = "120/minute"
+_BURST_LIMIT = "20/second;300/minute"
+
+# X-RateLimit-Limit value as sent by the 429 handler and the middleware
+_RL_LIMIT_STR = str(settings.rate_limit_per_minute)
+_RL_LIMIT_BYTES = _RL_LIMIT_STR.encode()
+_HDR_TUPLE = (b"x-ratelimit-limit", _RL_LIMIT_BYTES)
+
+# Header names pre-lowercased to match Starlette's stored header keys
+_XFF_HEADER = "x-forwarded-for"
+_REAL_IP_HEADER = "x-real-ip"
+
+
 def get_client_identifier(request: Request) -> str:
     """
     Get unique client identifier for rate limiting.
     Uses X-Forwarded-For header if behind proxy, otherwise remote address.
+    The result is cached on request.state, so the limiter, the deny cache
+    and the 429 handler parse the headers only once per request.
     
     Args:
         request: FastAPI request object
@@ -26,19 +64,35 @@ def get_client_identifier(request: Request) -> str:
     Returns:
         Client IP address or identifier
     """
+    client_id = getattr(request.state, "_cid", None)
+    if client_id is not None:
+        return client_id
+    
     # Check for forwarded header (when behind proxy/load balancer)
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    forwarded_for = request.headers.get(_XFF_HEADER)
     if forwarded_for:
-        # Get the first IP in the chain (original client)
-        return forwarded_for.split(",")[0].strip()
-    
-    # Check for real IP header
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip.strip()
+        # Get the first IP in the chain (original client) without
+        # splitting out every proxy hop
+        client_id = forwarded_for.partition(",")[0].strip()
+    else:
+        # Check for real IP header, then fall back to remote address
+        real_ip = request.headers.get(_REAL_IP_HEADER)
+        client_id = real_ip.strip() if real_ip else get_remote_address(request)
     
-    # Fallback to remote address
-    return get_remote_address(request)
+    request.state._cid = client_id
+    return client_id
+
+
+# BLAKE2b accepts keys of up to 64 bytes; longer secrets are digested first
+_KEY_SALT = settings.api_key_salt.encode()
+if len(_KEY_SALT) > 64:
+    _KEY_SALT = hashlib.blake2b(_KEY_SALT).digest()
+
+
+@lru_cache(maxsize=4096)
+def _hash_api_key(api_key: str) -> str:
+    """Keyed BLAKE2b-128 digest of an API key (keys repeat, so results are cached)."""
+    return hashlib.blake2b(api_key.encode(), digest_size=16, key=_KEY_SALT).hexdigest()
 
 
 def get_api_key_identifier(request: Request) -> str:
@@ -54,20 +108,142 @@ def get_api_key_identifier(request: Request) -> str:
     """
     api_key = request.headers.get("X-API-Key")
     if api_key:
-        return f"api_key:{api_key[:16]}"  # Use prefix of API key
+        # Digest rather than a raw key prefix, so keys never reach Redis or logs
+        return f"api_key:{_hash_api_key(api_key)}"
     return get_client_identifier(request)
 
 
+# One process-wide pool shared by every limit check. slowapi consults its
+# storage synchronously on the event loop, so timeouts are kept short: a slow
+# or missing Redis trips the in-memory fallback instead of stalling requests.
+_redis_pool = (
+    redis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=0.5,
+        health_check_interval=30,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+        socket_keepalive=True
+    )
+    if REDIS_AVAILABLE else None
+)
+
+# (path, client) -> (monotonic deadline, exceeded limit). A client known to
+# be over its limit is rejected locally until the window resets, so floods
+# from one offender stop reaching Redis after the first rejection.
+_deny_cache: Dict[Tuple[str, str], Tuple[float, Limit]] = {}
+DENY_CACHE_MAX_SIZE = 10_000
+
+
+def _cached_denial(key: Tuple[str, str]) -> Optional[Limit]:
+    """Return the exceeded limit if `key` is still inside a known denial."""
+    entry = _deny_cache.get(key)
+    if entry is None:
+        return None
+    deny_until, limit = entry
+    if time.monotonic() < deny_until:
+        return limit
+    del _deny_cache[key]
+    return None
+
+
+def _remember_denial(key: Tuple[str, str], seconds: float, limit: Limit) -> None:
+    """Reject `key` locally for the next `seconds`."""
+    if seconds <= 0:
+        return
+    now = time.monotonic()
+    if len(_deny_cache) >= DENY_CACHE_MAX_SIZE:
+        # Sweep on the insert path rather than from a background task
+        for expired in [k for k, (until, _) in _deny_cache.items() if until <= now]:
+            del _deny_cache[expired]
+        if len(_deny_cache) >= DENY_CACHE_MAX_SIZE:
+            return
+    _deny_cache[key] = (now + seconds, limit)
+
+
+class _DenyCachingLimiter(Limiter):
+    """Limiter that answers repeat requests from rejected clients locally."""
+    
+    def _check_request_limit(self, request, endpoint_func, in_middleware=True):
+        key = (request["path"], get_client_identifier(request))
+        denied = _cached_denial(key)
+        if denied is not None:
+            raise RateLimitExceeded(denied)
+        try:
+            super()._check_request_limit(request, endpoint_func, in_middleware)
+        except RateLimitExceeded as exc:
+            # slowapi records the limit that was hit just before raising
+            limit_item, args = request.state.view_rate_limit
+            try:
+                reset_at, _ = self.limiter.get_window_stats(limit_item, *args)
+            except Exception:
+                raise exc
+            _remember_denial(key, reset_at - time.time(), exc.limit)
+            raise
+
+
 # Initialize rate limiter
-# In production with Redis:
-# limiter = Limiter(key_func=get_client_identifier, storage_uri=settings.redis_url)
-# For development without Redis:
-limiter = Limiter(
+# Counters live in Redis so every worker shares them. The sliding window
+# counter keeps two integers per client and window (current and previous
+# period, weighted by overlap), so each hit is one O(1) script call
+# (registered once, then sent by SHA) and boundary bursts are smoothed out.
+# Falls back to in-memory counters (per process) while Redis is unreachable.
+limiter = _DenyCachingLimiter(
     key_func=get_client_identifier,
-    default_limits=[f"{settings.rate_limit_per_minute}/minute"]
+    default_limits=[_STD_LIMIT],
+    storage_uri=settings.redis_url if REDIS_AVAILABLE else "memory://",
+    storage_options={"connection_pool": _redis_pool} if REDIS_AVAILABLE else {},
+    strategy="sliding-window-counter",
+    in_memory_fallback_enabled=True
 )
 
 
+# Constant part of every 429 body; only the message and timestamp vary
+_RATE_LIMIT_ERROR_CODE = "RATE_LIMIT_EXCEEDED"
+_RATE_LIMIT_ERROR_DETAILS = {"retry_after": "60 seconds"}
+
+# Response only reads this mapping when encoding its raw headers
+_429_HEADERS = {
+    "Retry-After": "60",
+    "X-RateLimit-Limit": _RL_LIMIT_STR,
+    "X-RateLimit-Remaining": "0"
+}
+
+# Same length as a whole-second timestamp ("2026-01-01T09:15:00Z")
+_TS_PLACEHOLDER = b"0000-00-00T00:00:00Z"
+_TS_LEN = len(_TS_PLACEHOLDER)
+
+
+def _json_bytes(content: dict) -> bytes:
+    """Encode a response body (orjson when available, compact stdlib JSON otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _body_template(detail: str) -> Tuple[bytes, int]:
+    """Encoded 429 body for a limit, with the offset of its timestamp placeholder."""
+    template = _json_bytes({
+        "success": False,
+        "error": {
+            "code": _RATE_LIMIT_ERROR_CODE,
+            "message": f"Rate limit exceeded: {detail}",
+            "details": _RATE_LIMIT_ERROR_DETAILS
+        },
+        "timestamp": _TS_PLACEHOLDER.decode()
+    })
+    # The timestamp is the last field, so search from the end
+    return template, template.rindex(_TS_PLACEHOLDER)
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_second: int) -> bytes:
+    """ISO-8601 UTC timestamp for a whole second (reused within that second)."""
+    return (datetime.utcfromtimestamp(epoch_second).isoformat() + "Z").encode()
+
+
 def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> Response:
     """
     Custom handler for rate limit exceeded errors.
@@ -79,89 +255,148 @@ def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> Response:
     Returns:
         JSON response with rate limit error
     """
-    from fastapi.responses import JSONResponse
-    from datetime import datetime
-    
-    logger.warning(
-        "rate_limit_exceeded",
-        client_ip=get_client_identifier(request),
-        path=request.url.path,
-        limit=str(exc.detail)
-    )
+    detail = str(exc.detail)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "rate_limit_exceeded",
+            client_ip=get_client_identifier(request),
+            path=request.url.path,
+            limit=detail
+        )
     
-    return JSONResponse(
+    # Only the timestamp changes between 429s for the same limit, so patch
+    # it into the pre-encoded body instead of building and encoding a dict
+    template, offset = _body_template(detail)
+    body = bytearray(template)
+    body[offset:offset + _TS_LEN] = _iso_timestamp(int(time.time()))
+    
+    return Response(
+        content=bytes(body),
         status_code=429,
-        content={
-            "success": False,
-            "error": {
-                "code": "RATE_LIMIT_EXCEEDED",
-                "message": f"Rate limit exceeded: {exc.detail}",
-                "details": {
-                    "retry_after": "60 seconds"
-                }
-            },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        },
-        headers={
-            "Retry-After": "60",
-            "X-RateLimit-Limit": str(settings.rate_limit_per_minute),
-            "X-RateLimit-Remaining": "0"
-        }
+        media_type="application/json",
+        headers=_429_HEADERS
     )
 
 
-# Rate limiting decorators for different tiers
-def rate_limit_standard(func: Callable) -> Callable:
-    """
-    Standard rate limit decorator (60/minute).
-    Use for regular endpoints.
-    """
-    @wraps(func)
-    @limiter.limit(f"{settings.rate_limit_per_minute}/minute")
-    async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
-    return wrapper
+# Applies every window of a compound limit in one round trip: INCR each
+# counter (setting its expiry on the first hit) and stop at the first window
+# over its limit. ARGV holds (amount, window_ms) pairs in KEYS order. Returns
+# {1-based index of the exceeded window, its remaining ms}, or {0, 0} when
+# all windows pass.
+_MULTI_WINDOW_LUA = """
+for i, key in ipairs(KEYS) do
+    local count = redis.call('INCR', key)
+    if count == 1 then
+        redis.call('PEXPIRE', key, ARGV[i * 2])
+    end
+    if count > tonumber(ARGV[i * 2 - 1]) then
+        return {i, redis.call('PTTL', key)}
+    end
+end
+return {0, 0}
+"""
 
+_multi_window_script = (
+    redis.Redis(connection_pool=_redis_pool).register_script(_MULTI_WINDOW_LUA)
+    if REDIS_AVAILABLE else None
+)
 
-def rate_limit_strict(func: Callable) -> Callable:
-    """
-    Strict rate limit decorator (10/minute).
-    Use for expensive operations like predictions.
-    """
-    @wraps(func)
-    @limiter.limit("10/minute")
-    async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
-    return wrapper
+# Seconds to skip Redis after a failed multi-window check
+MULTI_WINDOW_RETRY_SECONDS = 30
+_multi_window_retry_at = 0.0
 
 
-def rate_limit_relaxed(func: Callable) -> Callable:
-    """
-    Relaxed rate limit decorator (120/minute).
-    Use for lightweight endpoints like health checks.
-    """
-    @wraps(func)
-    @limiter.limit("120/minute")
-    async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
-    return wrapper
+def _find_request(args: tuple, kwargs: dict) -> Optional[Request]:
+    """Locate the Request among an endpoint's call arguments."""
+    request = kwargs.get("request")
+    if isinstance(request, Request):
+        return request
+    for arg in args:
+        if isinstance(arg, Request):
+            return arg
+    return None
 
 
-def rate_limit_burst(func: Callable) -> Callable:
+def _multi_window_limit(limit_string: str) -> Callable:
     """
-    Burst rate limit decorator (300/minute, 20/second).
-    Use for high-frequency endpoints with burst protection.
+    Enforce a compound limit (e.g. "20/second;300/minute") with a single
+    Redis round trip per request instead of one per window.
+    
+    Windows are counted as fixed windows, in the limits key format. While
+    Redis is unreachable the endpoint is limited by slowapi instead.
+    
+    Args:
+        limit_string: Rate limit string with one or more ';'-separated windows
+        
+    Returns:
+        Decorator function
     """
-    @wraps(func)
-    @limiter.limit("20/second;300/minute")
-    async def wrapper(*args, **kwargs):
-        return await func(*args, **kwargs)
-    return wrapper
+    items = parse_many(limit_string)
+    wrapped_limits = [
+        Limit(item, get_client_identifier, None, False, None, None, None, 1, True)
+        for item in items
+    ]
+    script_args = [
+        value for item in items for value in (item.amount, item.get_expiry() * 1000)
+    ]
+    
+    def decorator(func: Callable) -> Callable:
+        fallback = limiter.limit(limit_string)(func)
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            global _multi_window_retry_at
+            request = _find_request(args, kwargs)
+            if (
+                _multi_window_script is None
+                or request is None
+                or time.monotonic() < _multi_window_retry_at
+            ):
+                return await fallback(*args, **kwargs)
+            
+            client = get_client_identifier(request)
+            scope = request["path"]
+            denied = _cached_denial((scope, client))
+            if denied is not None:
+                raise RateLimitExceeded(denied)
+            keys = [f"LIMITS:{item.key_for(client, scope)}" for item in items]
+            try:
+                exceeded, retry_ms = _multi_window_script(keys=keys, args=script_args)
+            except redis.RedisError as e:
+                _multi_window_retry_at = time.monotonic() + MULTI_WINDOW_RETRY_SECONDS
+                logger.warning("rate_limit_storage_unavailable", error=str(e))
+                return await fallback(*args, **kwargs)
+            if exceeded:
+                limit = wrapped_limits[exceeded - 1]
+                _remember_denial((scope, client), retry_ms / 1000, limit)
+                raise RateLimitExceeded(limit)
+            return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Rate limiting decorators for different tiers. Each tier is the limit
+# decorator itself, so endpoints run without a pass-through wrapper frame.
 
+# Standard (60/minute): regular endpoints
+rate_limit_standard = limiter.limit(_STD_LIMIT)
 
+# Strict (10/minute): expensive operations like predictions
+rate_limit_strict = limiter.limit(_STRICT_LIMIT)
+
+# Relaxed (120/minute): lightweight endpoints like health checks
+rate_limit_relaxed = limiter.limit(_RELAXED_LIMIT)
+
+# Burst (20/second, 300/minute): high-frequency endpoints with burst protection
+rate_limit_burst = _multi_window_limit(_BURST_LIMIT)
+
+
+@lru_cache(maxsize=64)
 def rate_limit_custom(limit_string: str) -> Callable:
     """
     Custom rate limit decorator.
+    Identical limit strings share one decorator instance, and compound
+    limits ("5/second;100/hour") check all windows in one round trip.
     
     Args:
         limit_string: Rate limit string (e.g., "100/hour", "5/minute")
@@ -171,16 +406,39 @@ def rate_limit_custom(limit_string: str) -> Callable:
         
     Example:
         @rate_limit_custom("100/hour")
-        async def my_endpoint():
+        async def my_endpoint(request: Request):
             ...
     """
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        @limiter.limit(limit_string)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        return wrapper
-    return decorator
+    if len(parse_many(limit_string)) > 1:
+        return _multi_window_limit(limit_string)
+    return limiter.limit(limit_string)
+
+
+# Probe endpoints are not rate limited, so their (frequent) responses skip
+# the header rewrite entirely
+_SKIP_PATHS = frozenset({"/health", "/metrics", "/readyz", "/api/v1/health"})
+_SKIP_PREFIX = re.compile(r"/(?:api/v1/)?(?:health|metrics)/")
+
+
+class _SendWrapper:
+    """ASGI send callable that appends the rate limit header to responses."""
+    
+    __slots__ = ("send",)
+    
+    def __init__(self, send):
+        self.send = send
+    
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            # Replace any limit header the response set itself, but keep other
+            # repeated headers such as Set-Cookie intact
+            headers = [
+                header for header in message.get("headers", ())
+                if header[0].lower() != _HDR_TUPLE[0]
+            ]
+            headers.append(_HDR_TUPLE)
+            message["headers"] = headers
+        await self.send(message)
 
 
 class RateLimitMiddleware:
@@ -188,6 +446,8 @@ class RateLimitMiddleware:
     Middleware to add rate limit headers to responses.
     """
     
+    __slots__ = ("app",)
+    
     def __init__(self, app):
         self.app = app
     
@@ -196,12 +456,9 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
         
-        async def send_wrapper(message):
-            if message["type"] == "http.response.start":
-                headers = dict(message.get("headers", []))
-                # Add rate limit headers
-                headers[b"x-ratelimit-limit"] = str(settings.rate_limit_per_minute).encode()
-                message["headers"] = list(headers.items())
-            await send(message)
+        path = scope["path"]
+        if path in _SKIP_PATHS or _SKIP_PREFIX.match(path):
+            await self.app(scope, receive, send)
+            return
         
-        await self.app(scope, receive, send_wrapper)
+        await self.app(scope, receive, _SendWrapper(send))
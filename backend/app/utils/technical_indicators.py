@@ -4,10 +4,520 @@ Comprehensive technical analysis utilities for stock market analysis.
 All calculations are vectorized using pandas/numpy for efficiency.
 """
 
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
+from scipy.signal import lfilter
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+
+# Working precision for indicator arrays. pandas rolling/ewm accumulate in
+# float64 regardless of input dtype, so narrower types only add casts.
+_DTYPE = np.float64
+
+
+def _prep(x: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Contiguous ``_DTYPE`` array view/copy of a Series or array input."""
+    if isinstance(x, pd.Series):
+        x = x.to_numpy(dtype=_DTYPE)
+    return np.ascontiguousarray(x, dtype=_DTYPE)
+
+def _ewm_adjust_false(arr: np.ndarray, span: int) -> np.ndarray:
+    """
+    EMA equivalent to ``pd.Series(arr).ewm(span=span, adjust=False).mean()``.
+    
+    Runs the recursion y[i] = alpha * x[i] + (1 - alpha) * y[i-1] as a
+    first-order IIR filter over the raw array, seeded so that y[0] = x[0].
+    Inputs with NaNs go through pandas, whose EWM carries the last value
+    across gaps instead of propagating NaN.
+    """
+    if arr.size == 0 or np.isnan(arr).any():
+        return pd.Series(arr).ewm(span=span, adjust=False).mean().to_numpy()
+    alpha = 2.0 / (span + 1.0)
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], arr, zi=[arr[0] * (1.0 - alpha)])
+    return out
+
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True range as ``max(high - low, |high - prev close|, |low - prev close|)``.
+    
+    Uses ``np.fmax`` so NaN terms are skipped like the row-wise pandas max,
+    which leaves the first bar as ``high - low``.
+    """
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    return np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _rolling_mean_kernel(x, window):
+        """
+        ``pd.Series(x).rolling(window).mean()`` as one compiled pass.
+        
+        Mirrors pandas' float handling (compensated add/remove sums, exact
+        result for runs of equal values, sign clamping) so outputs match,
+        including exact zeros over flat windows.
+        """
+        n = x.size
+        out = np.full(n, np.nan)
+        nobs = 0
+        neg_ct = 0
+        sum_x = 0.0
+        comp_add = 0.0
+        comp_remove = 0.0
+        same_run = 0
+        prev = x[0] if n > 0 else np.nan
+        for i in range(n):
+            if i >= window:
+                val = x[i - window]
+                if val == val:
+                    nobs -= 1
+                    y = -val - comp_remove
+                    t = sum_x + y
+                    comp_remove = t - sum_x - y
+                    sum_x = t
+                    if np.signbit(val):
+                        neg_ct -= 1
+            val = x[i]
+            if val == val:
+                nobs += 1
+                y = val - comp_add
+                t = sum_x + y
+                comp_add = t - sum_x - y
+                sum_x = t
+                if np.signbit(val):
+                    neg_ct += 1
+                if val == prev:
+                    same_run += 1
+                else:
+                    same_run = 1
+                prev = val
+            if nobs >= window:
+                result = sum_x / nobs
+                if same_run >= nobs:
+                    result = prev
+                elif neg_ct == 0 and result < 0:
+                    result = 0.0
+                elif neg_ct == nobs and result > 0:
+                    result = 0.0
+                out[i] = result
+        return out
+
+    @njit(cache=True)
+    def _roll_mean_std_kernel(x, window):
+        """
+        Rolling mean and sample std (ddof=1) in one compiled pass.
+        
+        The mean is accumulated as in _rolling_mean_kernel and the variance
+        with pandas' Kahan-compensated Welford add/remove updates, so both
+        match ``rolling(window).mean()`` and ``rolling(window).std()``.
+        """
+        n = x.size
+        mean_out = np.full(n, np.nan)
+        std_out = np.full(n, np.nan)
+        nobs = 0
+        neg_ct = 0
+        sum_x = 0.0
+        comp_add = 0.0
+        comp_remove = 0.0
+        mean_x = 0.0
+        ssqdm_x = 0.0
+        var_comp_add = 0.0
+        var_comp_remove = 0.0
+        same_run = 0
+        prev = x[0] if n > 0 else np.nan
+        for i in range(n):
+            if i >= window:
+                val = x[i - window]
+                if val == val:
+                    nobs -= 1
+                    y = -val - comp_remove
+                    t = sum_x + y
+                    comp_remove = t - sum_x - y
+                    sum_x = t
+                    if np.signbit(val):
+                        neg_ct -= 1
+                    if nobs:
+                        prev_mean = mean_x - var_comp_remove
+                        y = val - var_comp_remove
+                        t = y - mean_x
+                        var_comp_remove = t + mean_x - y
+                        mean_x = mean_x - t / nobs
+                        ssqdm_x = ssqdm_x - (val - prev_mean) * (val - mean_x)
+                    else:
+                        mean_x = 0.0
+                        ssqdm_x = 0.0
+            val = x[i]
+            if val == val:
+                nobs += 1
+                y = val - comp_add
+                t = sum_x + y
+                comp_add = t - sum_x - y
+                sum_x = t
+                if np.signbit(val):
+                    neg_ct += 1
+                prev_mean = mean_x - var_comp_add
+                y = val - var_comp_add
+                t = y - mean_x
+                var_comp_add = t + mean_x - y
+                mean_x = mean_x + t / nobs
+                ssqdm_x = ssqdm_x + (val - prev_mean) * (val - mean_x)
+                if val == prev:
+                    same_run += 1
+                else:
+                    same_run = 1
+                prev = val
+            if nobs >= window:
+                result = sum_x / nobs
+                if same_run >= nobs:
+                    result = prev
+                elif neg_ct == 0 and result < 0:
+                    result = 0.0
+                elif neg_ct == nobs and result > 0:
+                    result = 0.0
+                mean_out[i] = result
+                if nobs > 1:
+                    var = 0.0 if same_run >= nobs else ssqdm_x / (nobs - 1)
+                    # Rounding can leave a tiny negative variance
+                    std_out[i] = 0.0 if var < 0 else np.sqrt(var)
+        return mean_out, std_out
+
+    @njit(cache=True)
+    def _macd_kernel(x, fast_period, slow_period, signal_period):
+        """
+        Fast/slow EMAs, MACD, signal and histogram in one pass over NaN-free x.
+        
+        Each EMA follows _ewm_adjust_false's recursion term for term
+        (seeded with its first input), so results match the three-filter path.
+        """
+        n = x.size
+        macd_line = np.empty(n)
+        signal_line = np.empty(n)
+        histogram = np.empty(n)
+        a_fast = 2.0 / (fast_period + 1.0)
+        a_slow = 2.0 / (slow_period + 1.0)
+        a_sig = 2.0 / (signal_period + 1.0)
+        fast = x[0]
+        slow = x[0]
+        sig = np.nan
+        for i in range(n):
+            fast = a_fast * x[i] + fast * (1.0 - a_fast)
+            slow = a_slow * x[i] + slow * (1.0 - a_slow)
+            macd = fast - slow
+            if i == 0:
+                sig = macd
+            sig = a_sig * macd + sig * (1.0 - a_sig)
+            macd_line[i] = macd
+            signal_line[i] = sig
+            histogram[i] = macd - sig
+        return macd_line, signal_line, histogram
+
+    @njit(cache=True)
+    def _rsi_kernel(prices, period):
+        """RSI from simple moving averages of gains and losses (50 where undefined)."""
+        n = prices.size
+        gain = np.zeros(n)
+        # pandas negates a zero-filled series here, so non-losses are -0.0
+        loss = np.full(n, -0.0)
+        for i in range(1, n):
+            d = prices[i] - prices[i - 1]
+            if d > 0:
+                gain[i] = d
+            elif d < 0:
+                loss[i] = -d
+        avg_gain = _rolling_mean_kernel(gain, period)
+        avg_loss = _rolling_mean_kernel(loss, period)
+        out = np.full(n, 50.0)
+        for i in range(n):
+            if avg_loss[i] != 0:
+                rsi = 100 - 100 / (1 + avg_gain[i] / avg_loss[i])
+                if rsi == rsi:
+                    out[i] = rsi
+        return out
+
+    @njit(cache=True, error_model="numpy")
+    def _adx_kernel(high, low, close, period):
+        """
+        ADX and directional indicators from one walk over high/low/close.
+        
+        True range and +DM/-DM are built in a single loop and smoothed with
+        the same rolling mean as pandas; returns (adx, +DI, -DI) with 0
+        where undefined.
+        """
+        n = close.size
+        tr = np.empty(n)
+        plus_dm = np.zeros(n)
+        minus_dm = np.zeros(n)
+        for i in range(n):
+            # Row-wise max skipping NaN, as DataFrame.max(axis=1) does
+            best = high[i] - low[i]
+            if i > 0:
+                for cand in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                    if best != best or cand > best:
+                        best = cand
+                up = high[i] - high[i - 1]
+                down = low[i - 1] - low[i]
+                if up > down and up > 0:
+                    plus_dm[i] = up
+                if down > up and down > 0:
+                    minus_dm[i] = down
+            tr[i] = best
+        atr = _rolling_mean_kernel(tr, period)
+        plus_di = 100 * (_rolling_mean_kernel(plus_dm, period) / atr)
+        minus_di = 100 * (_rolling_mean_kernel(minus_dm, period) / atr)
+        dx = np.empty(n)
+        for i in range(n):
+            total = plus_di[i] + minus_di[i]
+            if total == 0:
+                dx[i] = np.nan
+            else:
+                dx[i] = 100 * abs(plus_di[i] - minus_di[i]) / total
+            if plus_di[i] != plus_di[i]:
+                plus_di[i] = 0.0
+            if minus_di[i] != minus_di[i]:
+                minus_di[i] = 0.0
+        adx = _rolling_mean_kernel(dx, period)
+        for i in range(n):
+            if adx[i] != adx[i]:
+                adx[i] = 0.0
+        return adx, plus_di, minus_di
+
+    @njit(cache=True)
+    def _obv_kernel(prices, volume):
+        """Running sum of sign(price change) * volume; NaN terms are skipped."""
+        n = prices.size
+        out = np.empty(n)
+        total = 0.0
+        for i in range(n):
+            if i == 0:
+                term = 0.0 * volume[0]
+            else:
+                term = np.sign(prices[i] - prices[i - 1]) * volume[i]
+            if term != term:
+                out[i] = np.nan
+            else:
+                total += term
+                out[i] = total
+        return out
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile the numba kernels ahead of the first request.
+    
+    Kernels use ``cache=True`` so this is normally a load from numba's
+    on-disk cache; on a fresh install it moves the one-off compile to
+    process startup. Inputs match the dtypes the indicators pass in.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    x = np.linspace(1.0, 2.0, 32)
+    _rolling_mean_kernel(x, 3)
+    _roll_mean_std_kernel(x, 3)
+    _macd_kernel(x, 12, 26, 9)
+    _rsi_kernel(x, 14)
+    _adx_kernel(x + 1.0, x - 1.0, x, 14)
+    _obv_kernel(x, x)
+
+# ==================== NUMPY CORES ====================
+# Array-in, array-out implementations behind the public TechnicalIndicators
+# methods, so composite calculations never round-trip through pd.Series.
+
+
+def _rolling_mean_np(arr: np.ndarray, window: int) -> np.ndarray:
+    """``rolling(window).mean()`` over a float64 array."""
+    if NUMBA_AVAILABLE:
+        return _rolling_mean_kernel(arr, window)
+    return pd.Series(arr).rolling(window=window).mean().to_numpy()
+
+
+def _rolling_mean_std_np(arr: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and sample standard deviation over window."""
+    if NUMBA_AVAILABLE:
+        return _roll_mean_std_kernel(arr, window)
+    rolling = pd.Series(arr).rolling(window=window)
+    return rolling.mean().to_numpy(), rolling.std().to_numpy()
+
+
+def _calculate_rsi_np(arr: np.ndarray, period: int) -> np.ndarray:
+    """RSI with undefined values (flat or warm-up windows) set to 50."""
+    if NUMBA_AVAILABLE:
+        return _rsi_kernel(arr, period)
+    
+    delta = np.empty_like(arr)
+    delta[:1] = np.nan
+    delta[1:] = arr[1:] - arr[:-1]
+    gain = _rolling_mean_np(np.where(delta > 0, delta, 0.0), period)
+    loss = _rolling_mean_np(-np.where(delta < 0, delta, 0.0), period)
+    loss[loss == 0] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + gain / loss))
+    rsi[np.isnan(rsi)] = 50.0
+    return rsi
+
+
+def _calculate_macd_np(
+    arr: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram."""
+    if NUMBA_AVAILABLE and arr.size and not np.isnan(arr).any():
+        return _macd_kernel(arr, fast_period, slow_period, signal_period)
+    macd_line = _ewm_adjust_false(arr, fast_period) - _ewm_adjust_false(arr, slow_period)
+    signal_line = _ewm_adjust_false(macd_line, signal_period)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def _calculate_stochastic_np(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    smooth_k: int,
+    smooth_d: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Smoothed %K and %D with undefined values set to 50."""
+    if BOTTLENECK_AVAILABLE:
+        lowest_low = bn.move_min(low, window=period, min_count=period)
+        highest_high = bn.move_max(high, window=period, min_count=period)
+    else:
+        lowest_low = pd.Series(low).rolling(window=period).min().to_numpy()
+        highest_high = pd.Series(high).rolling(window=period).max().to_numpy()
+    
+    price_range = highest_high - lowest_low
+    price_range[price_range == 0] = np.nan
+    k = _rolling_mean_np(100 * (close - lowest_low) / price_range, smooth_k)
+    d = _rolling_mean_np(k, smooth_d)
+    # %D is smoothed from the unfilled %K, so only fill afterwards
+    k[np.isnan(k)] = 50.0
+    d[np.isnan(d)] = 50.0
+    return k, d
+
+
+def _calculate_adx_np(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ADX, +DI and -DI with undefined values set to 0."""
+    if NUMBA_AVAILABLE:
+        return _adx_kernel(high, low, close, period)
+    
+    atr = _rolling_mean_np(_true_range(high, low, close), period)
+    
+    # Directional Movement, aligned on the later bar of each pair
+    up_move = np.full_like(high, np.nan)
+    down_move = np.full_like(low, np.nan)
+    up_move[1:] = high[1:] - high[:-1]
+    down_move[1:] = low[:-1] - low[1:]
+    
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plus_di = 100 * (_rolling_mean_np(plus_dm, period) / atr)
+        minus_di = 100 * (_rolling_mean_np(minus_dm, period) / atr)
+        
+        di_total = plus_di + minus_di
+        di_total[di_total == 0] = np.nan
+        dx = 100 * np.abs(plus_di - minus_di) / di_total
+    adx = _rolling_mean_np(dx, period)
+    for arr in (adx, plus_di, minus_di):
+        arr[np.isnan(arr)] = 0.0
+    return adx, plus_di, minus_di
+
+
+def _calculate_bollinger_np(
+    middle: np.ndarray,
+    std: np.ndarray,
+    prices: np.ndarray,
+    std_dev: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Upper and lower bands, bandwidth (NaN -> 0) and %B (NaN -> 50)."""
+    upper = middle + (std * std_dev)
+    lower = middle - (std * std_dev)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bandwidth = (upper - lower) / middle * 100
+        percent_b = (prices - lower) / (upper - lower) * 100
+    bandwidth[np.isnan(bandwidth)] = 0.0
+    percent_b[np.isnan(percent_b)] = 50.0
+    return upper, lower, bandwidth, percent_b
+
+
+def _calculate_atr_np(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average of the true range."""
+    return _rolling_mean_np(_true_range(high, low, close), period)
+
+
+def _cumsum_skipna(arr: np.ndarray) -> np.ndarray:
+    """Running sum that skips NaN but keeps it in place, like Series.cumsum."""
+    out = np.nancumsum(arr)
+    out[np.isnan(arr)] = np.nan
+    return out
+
+
+def _calculate_obv_np(prices: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """On-balance volume; positions with a NaN term stay NaN."""
+    if NUMBA_AVAILABLE:
+        return _obv_kernel(prices, volume)
+    direction = np.zeros(prices.size, dtype=np.int8)
+    direction[1:] = (
+        (prices[1:] > prices[:-1]).view(np.int8) - (prices[1:] < prices[:-1]).view(np.int8)
+    )
+    terms = direction * volume
+    # Comparisons against NaN read as "no change"; those terms stay NaN
+    missing = np.isnan(volume)
+    missing[1:] |= np.isnan(prices[1:]) | np.isnan(prices[:-1])
+    terms[missing] = np.nan
+    return _cumsum_skipna(terms)
+
+
+def _calculate_vwap_np(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray
+) -> np.ndarray:
+    """Cumulative volume weighted typical price."""
+    typical_price = (high + low + close) / 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _cumsum_skipna(typical_price * volume) / _cumsum_skipna(volume)
+
+
+
+# Bucket index per signal label used when tallying signals; anything else counts as hold
+_SIGNAL_KIND = {"buy": 0, "sell": 1}
 
 
 @dataclass
@@ -18,6 +528,49 @@ class SignalResult:
     reason: str
 
 
+@dataclass
+class OHLCV:
+    """
+    Price bars as contiguous float64 arrays sharing one index.
+    
+    Built once per analysis so indicators that read several columns reuse
+    the same converted arrays instead of re-wrapping each input.
+    """
+    close: np.ndarray
+    index: pd.Index
+    open: Optional[np.ndarray] = None
+    high: Optional[np.ndarray] = None
+    low: Optional[np.ndarray] = None
+    volume: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_series(
+        cls,
+        close: Union[pd.Series, np.ndarray],
+        high: Optional[Union[pd.Series, np.ndarray]] = None,
+        low: Optional[Union[pd.Series, np.ndarray]] = None,
+        volume: Optional[Union[pd.Series, np.ndarray]] = None,
+        open: Optional[Union[pd.Series, np.ndarray]] = None
+    ) -> "OHLCV":
+        """Build from individual columns; the index is taken from close."""
+        close = pd.Series(close)
+        return cls(
+            close=_prep(close),
+            index=close.index,
+            open=None if open is None else _prep(open),
+            high=None if high is None else _prep(high),
+            low=None if low is None else _prep(low),
+            volume=None if volume is None else _prep(volume)
+        )
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "OHLCV":
+        """Build from a frame with 'close' and optional 'open'/'high'/'low'/'volume'."""
+        return cls.from_series(
+            df['close'], df.get('high'), df.get('low'), df.get('volume'), df.get('open')
+        )
+
+
 class TechnicalIndicators:
     """
     Static methods for calculating technical indicators.
@@ -48,15 +601,7 @@ class TechnicalIndicators:
             return pd.Series([np.nan] * len(prices), index=getattr(prices, 'index', None))
         
         prices = pd.Series(prices)
-        delta = prices.diff()
-        
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss.replace(0, np.nan)
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi.fillna(50)
+        return pd.Series(_calculate_rsi_np(_prep(prices), period), index=prices.index)
 
     @staticmethod
     def calculate_macd(
@@ -85,18 +630,14 @@ class TechnicalIndicators:
             >>> histogram = macd['histogram']
         """
         prices = pd.Series(prices)
-        
-        ema_fast = prices.ewm(span=fast_period, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow_period, adjust=False).mean()
-        
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-        histogram = macd_line - signal_line
+        macd_line, signal_line, histogram = _calculate_macd_np(
+            _prep(prices), fast_period, slow_period, signal_period
+        )
         
         return {
-            'macd_line': macd_line,
-            'signal_line': signal_line,
-            'histogram': histogram
+            'macd_line': pd.Series(macd_line, index=prices.index),
+            'signal_line': pd.Series(signal_line, index=prices.index),
+            'histogram': pd.Series(histogram, index=prices.index)
         }
 
     @staticmethod
@@ -125,18 +666,12 @@ class TechnicalIndicators:
         Returns:
             Dict with 'k' and 'd' lines
         """
-        high = pd.Series(high)
-        low = pd.Series(low)
         close = pd.Series(close)
+        k, d = _calculate_stochastic_np(
+            _prep(high), _prep(low), _prep(close), period, smooth_k, smooth_d
+        )
         
-        lowest_low = low.rolling(window=period).min()
-        highest_high = high.rolling(window=period).max()
-        
-        k = 100 * (close - lowest_low) / (highest_high - lowest_low).replace(0, np.nan)
-        k = k.rolling(window=smooth_k).mean()
-        d = k.rolling(window=smooth_d).mean()
-        
-        return {'k': k.fillna(50), 'd': d.fillna(50)}
+        return {'k': pd.Series(k, index=close.index), 'd': pd.Series(d, index=close.index)}
 
     # ==================== TREND INDICATORS ====================
 
@@ -182,7 +717,11 @@ class TechnicalIndicators:
             Dict mapping window name to EMA series
         """
         prices = pd.Series(prices)
-        return {f'ema_{w}': prices.ewm(span=w, adjust=False).mean() for w in windows}
+        arr = _prep(prices)
+        return {
+            f'ema_{w}': pd.Series(_ewm_adjust_false(arr, w), index=prices.index)
+            for w in windows
+        }
 
     @staticmethod
     def calculate_adx(
@@ -206,34 +745,13 @@ class TechnicalIndicators:
         Returns:
             Dict with 'adx', 'di_plus', 'di_minus'
         """
-        high = pd.Series(high)
-        low = pd.Series(low)
         close = pd.Series(close)
-        
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
-        
-        # Directional Movement
-        up_move = high - high.shift(1)
-        down_move = low.shift(1) - low
-        
-        plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0)
-        minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0)
-        
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
-        
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di).replace(0, np.nan)
-        adx = dx.rolling(window=period).mean()
+        adx, plus_di, minus_di = _calculate_adx_np(_prep(high), _prep(low), _prep(close), period)
         
         return {
-            'adx': adx.fillna(0),
-            'di_plus': plus_di.fillna(0),
-            'di_minus': minus_di.fillna(0)
+            'adx': pd.Series(adx, index=close.index),
+            'di_plus': pd.Series(plus_di, index=close.index),
+            'di_minus': pd.Series(minus_di, index=close.index)
         }
 
     # ==================== VOLATILITY INDICATORS ====================
@@ -259,22 +777,45 @@ class TechnicalIndicators:
             Dict with 'upper', 'middle', 'lower', 'bandwidth', 'percent_b'
         """
         prices = pd.Series(prices)
+        middle, std = _rolling_mean_std_np(_prep(prices), period)
         
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
+        return TechnicalIndicators.calculate_bollinger_bands_from(
+            pd.Series(middle, index=prices.index), std, prices, std_dev
+        )
+
+    @staticmethod
+    def calculate_bollinger_bands_from(
+        middle: pd.Series,
+        std: Union[pd.Series, np.ndarray],
+        prices: Union[pd.Series, np.ndarray],
+        std_dev: float = 2.0
+    ) -> Dict[str, pd.Series]:
+        """
+        Calculate Bollinger Bands from an already computed rolling mean and std.
         
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
+        Lets callers that have the period SMA (e.g. 'sma_20' from calculate_sma)
+        reuse it as the middle band instead of recomputing it.
         
-        bandwidth = (upper - lower) / middle * 100
-        percent_b = (prices - lower) / (upper - lower) * 100
+        Args:
+            middle: Rolling mean of prices over the band period
+            std: Rolling standard deviation over the same period
+            prices: Series of closing prices
+            std_dev: Standard deviation multiplier (default 2)
+            
+        Returns:
+            Dict with 'upper', 'middle', 'lower', 'bandwidth', 'percent_b'
+        """
+        index = middle.index
+        upper, lower, bandwidth, percent_b = _calculate_bollinger_np(
+            _prep(middle), _prep(std), _prep(prices), std_dev
+        )
         
         return {
-            'upper': upper,
+            'upper': pd.Series(upper, index=index),
             'middle': middle,
-            'lower': lower,
-            'bandwidth': bandwidth.fillna(0),
-            'percent_b': percent_b.fillna(50)
+            'lower': pd.Series(lower, index=index),
+            'bandwidth': pd.Series(bandwidth, index=index),
+            'percent_b': pd.Series(percent_b, index=index)
         }
 
     @staticmethod
@@ -300,17 +841,8 @@ class TechnicalIndicators:
             pd.Series: ATR values
         """
         high = pd.Series(high)
-        low = pd.Series(low)
-        close = pd.Series(close)
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
-        
-        return atr
+        atr = _calculate_atr_np(_prep(high), _prep(low), _prep(close), period)
+        return pd.Series(atr, index=high.index)
 
     # ==================== VOLUME INDICATORS ====================
 
@@ -333,13 +865,7 @@ class TechnicalIndicators:
             pd.Series: OBV values
         """
         prices = pd.Series(prices)
-        volume = pd.Series(volume)
-        
-        direction = np.sign(prices.diff())
-        direction.iloc[0] = 0
-        
-        obv = (direction * volume).cumsum()
-        return obv
+        return pd.Series(_calculate_obv_np(_prep(prices), _prep(volume)), index=prices.index)
 
     @staticmethod
     def calculate_vwap(
@@ -363,11 +889,89 @@ class TechnicalIndicators:
         Returns:
             pd.Series: VWAP values
         """
-        typical_price = (pd.Series(high) + pd.Series(low) + pd.Series(close)) / 3
-        volume = pd.Series(volume)
-        
-        vwap = (typical_price * volume).cumsum() / volume.cumsum()
-        return vwap
+        high = pd.Series(high)
+        vwap = _calculate_vwap_np(_prep(high), _prep(low), _prep(close), _prep(volume))
+        return pd.Series(vwap, index=high.index)
+
+    # ==================== OHLCV BUNDLE ====================
+    # Variants taking a prepared OHLCV; the bundle must carry the columns used.
+
+    @staticmethod
+    def calculate_rsi_soa(bars: OHLCV, period: int = 14) -> pd.Series:
+        """RSI of close; all NaN when there are not enough bars."""
+        if bars.close.size < period + 1:
+            return pd.Series(np.full(bars.close.size, np.nan), index=bars.index)
+        return pd.Series(_calculate_rsi_np(bars.close, period), index=bars.index)
+
+    @staticmethod
+    def calculate_macd_soa(
+        bars: OHLCV,
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9
+    ) -> Dict[str, pd.Series]:
+        """MACD with 'macd_line', 'signal_line', 'histogram' from close."""
+        macd_line, signal_line, histogram = _calculate_macd_np(
+            bars.close, fast_period, slow_period, signal_period
+        )
+        return {
+            'macd_line': pd.Series(macd_line, index=bars.index),
+            'signal_line': pd.Series(signal_line, index=bars.index),
+            'histogram': pd.Series(histogram, index=bars.index)
+        }
+
+    @staticmethod
+    def calculate_sma_soa(bars: OHLCV, windows: List[int] = [20, 50, 200]) -> Dict[str, pd.Series]:
+        """SMAs of close keyed 'sma_<window>'."""
+        return {
+            f'sma_{w}': pd.Series(_rolling_mean_np(bars.close, w), index=bars.index)
+            for w in windows
+        }
+
+    @staticmethod
+    def calculate_ema_soa(bars: OHLCV, windows: List[int] = [12, 26]) -> Dict[str, pd.Series]:
+        """EMAs of close keyed 'ema_<window>'."""
+        return {
+            f'ema_{w}': pd.Series(_ewm_adjust_false(bars.close, w), index=bars.index)
+            for w in windows
+        }
+
+    @staticmethod
+    def calculate_stochastic_soa(
+        bars: OHLCV,
+        period: int = 14,
+        smooth_k: int = 3,
+        smooth_d: int = 3
+    ) -> Dict[str, pd.Series]:
+        """Stochastic Oscillator (%K and %D) from high/low/close."""
+        k, d = _calculate_stochastic_np(bars.high, bars.low, bars.close, period, smooth_k, smooth_d)
+        return {'k': pd.Series(k, index=bars.index), 'd': pd.Series(d, index=bars.index)}
+
+    @staticmethod
+    def calculate_adx_soa(bars: OHLCV, period: int = 14) -> Dict[str, pd.Series]:
+        """ADX with 'adx', 'di_plus', 'di_minus' from high/low/close."""
+        adx, plus_di, minus_di = _calculate_adx_np(bars.high, bars.low, bars.close, period)
+        return {
+            'adx': pd.Series(adx, index=bars.index),
+            'di_plus': pd.Series(plus_di, index=bars.index),
+            'di_minus': pd.Series(minus_di, index=bars.index)
+        }
+
+    @staticmethod
+    def calculate_atr_soa(bars: OHLCV, period: int = 14) -> pd.Series:
+        """Average True Range from high/low/close."""
+        return pd.Series(_calculate_atr_np(bars.high, bars.low, bars.close, period), index=bars.index)
+
+    @staticmethod
+    def calculate_obv_soa(bars: OHLCV) -> pd.Series:
+        """On-Balance Volume from close/volume."""
+        return pd.Series(_calculate_obv_np(bars.close, bars.volume), index=bars.index)
+
+    @staticmethod
+    def calculate_vwap_soa(bars: OHLCV) -> pd.Series:
+        """Volume Weighted Average Price from high/low/close/volume."""
+        vwap = _calculate_vwap_np(bars.high, bars.low, bars.close, bars.volume)
+        return pd.Series(vwap, index=bars.index)
 
     # ==================== SUPPORT/RESISTANCE ====================
 
@@ -388,27 +992,25 @@ class TechnicalIndicators:
         Returns:
             Dict with 'support' and 'resistance' level lists
         """
-        prices = pd.Series(prices)
-        
-        # Find local minima (support)
-        local_min = prices.iloc[
-            (prices.shift(window) > prices) & 
-            (prices.shift(-window) > prices)
-        ].dropna()
-        
-        # Find local maxima (resistance)
-        local_max = prices.iloc[
-            (prices.shift(window) < prices) & 
-            (prices.shift(-window) < prices)
-        ].dropna()
+        arr = _prep(prices)
+        span = 2 * window + 1
+        if arr.size < span:
+            return {'support': [], 'resistance': []}
+        
+        # A point is a local extremum when it equals the min/max of the
+        # window centred on it (NaN windows never match)
+        windows = np.lib.stride_tricks.sliding_window_view(arr, span)
+        centers = arr[window:arr.size - window]
+        local_min = centers[centers == windows.min(axis=1)]
+        local_max = centers[centers == windows.max(axis=1)]
         
         # Get unique levels, sorted
-        support_levels = sorted(local_min.unique())[:num_levels] if len(local_min) > 0 else []
-        resistance_levels = sorted(local_max.unique(), reverse=True)[:num_levels] if len(local_max) > 0 else []
+        support_levels = np.unique(local_min)[:num_levels]
+        resistance_levels = np.unique(local_max)[::-1][:num_levels]
         
         return {
-            'support': [round(s, 2) for s in support_levels],
-            'resistance': [round(r, 2) for r in resistance_levels]
+            'support': [round(float(s), 2) for s in support_levels],
+            'resistance': [round(float(r), 2) for r in resistance_levels]
         }
 
     @staticmethod
@@ -470,11 +1072,13 @@ class TechnicalIndicators:
             pd.Series: Boolean series where True indicates a golden cross
         """
         sma_50 = pd.Series(sma_50)
-        sma_200 = pd.Series(sma_200)
+        a = _prep(sma_50)
+        b = _prep(sma_200)
         
         # Golden cross: 50 crosses above 200
-        golden_cross = (sma_50 > sma_200) & (sma_50.shift(1) <= sma_200.shift(1))
-        return golden_cross.fillna(False)
+        golden_cross = np.zeros(a.size, dtype=bool)
+        golden_cross[1:] = (a[1:] > b[1:]) & (a[:-1] <= b[:-1])
+        return pd.Series(golden_cross, index=sma_50.index)
 
     @staticmethod
     def detect_death_cross(
@@ -494,16 +1098,19 @@ class TechnicalIndicators:
             pd.Series: Boolean series where True indicates a death cross
         """
         sma_50 = pd.Series(sma_50)
-        sma_200 = pd.Series(sma_200)
+        a = _prep(sma_50)
+        b = _prep(sma_200)
         
         # Death cross: 50 crosses below 200
-        death_cross = (sma_50 < sma_200) & (sma_50.shift(1) >= sma_200.shift(1))
-        return death_cross.fillna(False)
+        death_cross = np.zeros(a.size, dtype=bool)
+        death_cross[1:] = (a[1:] < b[1:]) & (a[:-1] >= b[:-1])
+        return pd.Series(death_cross, index=sma_50.index)
 
     @staticmethod
     def identify_trend(
         prices: Union[pd.Series, np.ndarray],
-        period: int = 20
+        period: int = 20,
+        sma: Optional[pd.Series] = None
     ) -> str:
         """
         Identify the current trend direction.
@@ -513,6 +1120,7 @@ class TechnicalIndicators:
         Args:
             prices: Price series
             period: Period for trend detection
+            sma: Precomputed rolling mean over period (optional)
             
         Returns:
             str: "uptrend", "downtrend", or "sideways"
@@ -522,11 +1130,16 @@ class TechnicalIndicators:
         if len(prices) < period + 5:
             return "sideways"
         
-        sma = prices.rolling(window=period).mean()
-        sma_slope = sma.diff(5).iloc[-1]
+        if sma is None:
+            # Only the latest SMA and the one 5 bars back are needed
+            tail = _prep(prices.iloc[-(period + 5):])
+            sma_current = tail[-period:].mean()
+            sma_slope = sma_current - tail[:period].mean()
+        else:
+            sma_current = sma.iloc[-1]
+            sma_slope = sma_current - sma.iloc[-6]
         
         current_price = prices.iloc[-1]
-        sma_current = sma.iloc[-1]
         
         # Calculate percentage differences
         slope_threshold = sma_current * 0.001  # 0.1% threshold
@@ -540,6 +1153,97 @@ class TechnicalIndicators:
 
     # ==================== SIGNAL GENERATION ====================
 
+    @staticmethod
+    def _signal_from_rsi(rsi: pd.Series) -> SignalResult:
+        """Overbought/oversold signal from the latest RSI value."""
+        current_rsi = rsi.iloc[-1]
+        
+        if current_rsi > 70:
+            return SignalResult("sell", 80, "RSI indicates overbought condition")
+        elif current_rsi < 30:
+            return SignalResult("buy", 80, "RSI indicates oversold condition")
+        return SignalResult("hold", 50, "RSI in neutral zone")
+
+    @staticmethod
+    def _signal_from_macd(histogram: pd.Series) -> SignalResult:
+        """Momentum signal from the last two MACD histogram values."""
+        macd_hist = histogram.iloc[-1]
+        macd_hist_prev = histogram.iloc[-2] if len(histogram) > 1 else 0
+        
+        if macd_hist > 0 and macd_hist > macd_hist_prev:
+            return SignalResult("buy", 70, "MACD histogram rising above zero")
+        elif macd_hist < 0 and macd_hist < macd_hist_prev:
+            return SignalResult("sell", 70, "MACD histogram falling below zero")
+        return SignalResult("hold", 50, "MACD histogram neutral")
+
+    @staticmethod
+    def _signal_from_trend(trend: str) -> SignalResult:
+        """Signal from the trend label returned by identify_trend."""
+        if trend == "uptrend":
+            return SignalResult("buy", 60, "Price in uptrend")
+        elif trend == "downtrend":
+            return SignalResult("sell", 60, "Price in downtrend")
+        return SignalResult("hold", 50, "Price moving sideways")
+
+    @staticmethod
+    def _signal_from_bollinger(close: pd.Series, bollinger: Dict[str, pd.Series]) -> SignalResult:
+        """Signal from the latest close relative to the Bollinger Bands."""
+        current_price = close.iloc[-1]
+        
+        if current_price > bollinger['upper'].iloc[-1]:
+            return SignalResult("sell", 65, "Price above upper Bollinger Band")
+        elif current_price < bollinger['lower'].iloc[-1]:
+            return SignalResult("buy", 65, "Price below lower Bollinger Band")
+        return SignalResult("hold", 50, "Price within Bollinger Bands")
+
+    @staticmethod
+    def _signal_from_sma_cross(sma_50: pd.Series, sma_200: pd.Series) -> SignalResult:
+        """Golden/death cross signal from the 50 and 200 period SMAs."""
+        golden = TechnicalIndicators.detect_golden_cross(sma_50, sma_200)
+        death = TechnicalIndicators.detect_death_cross(sma_50, sma_200)
+        
+        if golden.iloc[-1]:
+            return SignalResult("buy", 90, "Golden cross detected")
+        elif death.iloc[-1]:
+            return SignalResult("sell", 90, "Death cross detected")
+        elif sma_50.iloc[-1] > sma_200.iloc[-1]:
+            return SignalResult("buy", 55, "50 SMA above 200 SMA")
+        return SignalResult("sell", 55, "50 SMA below 200 SMA")
+
+    @staticmethod
+    def generate_signals_from_precomputed(
+        close: pd.Series,
+        rsi: pd.Series,
+        macd: Dict[str, pd.Series],
+        trend: str,
+        bollinger: Dict[str, pd.Series],
+        smas: Dict[str, pd.Series]
+    ) -> Dict[str, SignalResult]:
+        """
+        Generate trading signals from indicators the caller has already computed.
+        
+        Args:
+            close: Closing prices
+            rsi: Output of calculate_rsi
+            macd: Output of calculate_macd
+            trend: Output of identify_trend
+            bollinger: Output of calculate_bollinger_bands
+            smas: Output of calculate_sma including 'sma_50' and 'sma_200'
+            
+        Returns:
+            Dict of indicator names to SignalResult objects
+        """
+        ti = TechnicalIndicators
+        signals = {
+            'rsi': ti._signal_from_rsi(rsi),
+            'macd': ti._signal_from_macd(macd['histogram']),
+            'trend': ti._signal_from_trend(trend),
+            'bollinger': ti._signal_from_bollinger(close, bollinger),
+        }
+        if len(close) >= 200:
+            signals['sma_cross'] = ti._signal_from_sma_cross(smas['sma_50'], smas['sma_200'])
+        return signals
+
     @staticmethod
     def generate_signals(
         close: pd.Series,
@@ -559,67 +1263,15 @@ class TechnicalIndicators:
         Returns:
             Dict of indicator names to SignalResult objects
         """
-        signals = {}
-        
-        # RSI Signal
-        rsi = TechnicalIndicators.calculate_rsi(close)
-        current_rsi = rsi.iloc[-1]
-        
-        if current_rsi > 70:
-            signals['rsi'] = SignalResult("sell", 80, "RSI indicates overbought condition")
-        elif current_rsi < 30:
-            signals['rsi'] = SignalResult("buy", 80, "RSI indicates oversold condition")
-        else:
-            signals['rsi'] = SignalResult("hold", 50, "RSI in neutral zone")
-        
-        # MACD Signal
-        macd = TechnicalIndicators.calculate_macd(close)
-        macd_hist = macd['histogram'].iloc[-1]
-        macd_hist_prev = macd['histogram'].iloc[-2] if len(macd['histogram']) > 1 else 0
-        
-        if macd_hist > 0 and macd_hist > macd_hist_prev:
-            signals['macd'] = SignalResult("buy", 70, "MACD histogram rising above zero")
-        elif macd_hist < 0 and macd_hist < macd_hist_prev:
-            signals['macd'] = SignalResult("sell", 70, "MACD histogram falling below zero")
-        else:
-            signals['macd'] = SignalResult("hold", 50, "MACD histogram neutral")
-        
-        # Trend Signal
-        trend = TechnicalIndicators.identify_trend(close)
-        if trend == "uptrend":
-            signals['trend'] = SignalResult("buy", 60, "Price in uptrend")
-        elif trend == "downtrend":
-            signals['trend'] = SignalResult("sell", 60, "Price in downtrend")
-        else:
-            signals['trend'] = SignalResult("hold", 50, "Price moving sideways")
-        
-        # Bollinger Bands Signal
-        bb = TechnicalIndicators.calculate_bollinger_bands(close)
-        current_price = close.iloc[-1]
-        
-        if current_price > bb['upper'].iloc[-1]:
-            signals['bollinger'] = SignalResult("sell", 65, "Price above upper Bollinger Band")
-        elif current_price < bb['lower'].iloc[-1]:
-            signals['bollinger'] = SignalResult("buy", 65, "Price below lower Bollinger Band")
-        else:
-            signals['bollinger'] = SignalResult("hold", 50, "Price within Bollinger Bands")
-        
-        # SMA Cross Signal
-        smas = TechnicalIndicators.calculate_sma(close, [50, 200])
-        if len(close) >= 200:
-            golden = TechnicalIndicators.detect_golden_cross(smas['sma_50'], smas['sma_200'])
-            death = TechnicalIndicators.detect_death_cross(smas['sma_50'], smas['sma_200'])
-            
-            if golden.iloc[-1]:
-                signals['sma_cross'] = SignalResult("buy", 90, "Golden cross detected")
-            elif death.iloc[-1]:
-                signals['sma_cross'] = SignalResult("sell", 90, "Death cross detected")
-            elif smas['sma_50'].iloc[-1] > smas['sma_200'].iloc[-1]:
-                signals['sma_cross'] = SignalResult("buy", 55, "50 SMA above 200 SMA")
-            else:
-                signals['sma_cross'] = SignalResult("sell", 55, "50 SMA below 200 SMA")
-        
-        return signals
+        ti = TechnicalIndicators
+        return ti.generate_signals_from_precomputed(
+            close,
+            rsi=ti.calculate_rsi(close),
+            macd=ti.calculate_macd(close),
+            trend=ti.identify_trend(close),
+            bollinger=ti.calculate_bollinger_bands(close),
+            smas=ti.calculate_sma(close, [50, 200])
+        )
 
     @staticmethod
     def get_overall_signal(signals: Dict[str, SignalResult]) -> SignalResult:
@@ -635,17 +1287,15 @@ class TechnicalIndicators:
         if not signals:
             return SignalResult("hold", 50, "Insufficient data for analysis")
         
-        buy_score = 0
-        sell_score = 0
-        hold_score = 0
-        
-        for signal in signals.values():
-            if signal.signal == "buy":
-                buy_score += signal.strength
-            elif signal.signal == "sell":
-                sell_score += signal.strength
-            else:
-                hold_score += signal.strength
+        # Tally strengths and counts per bucket: buy (0), sell (1), hold (2)
+        kinds = np.fromiter(
+            (_SIGNAL_KIND.get(s.signal, 2) for s in signals.values()), dtype=np.int8, count=len(signals)
+        )
+        strengths = np.fromiter(
+            (s.strength for s in signals.values()), dtype=np.float64, count=len(signals)
+        )
+        buy_score, sell_score, hold_score = np.bincount(kinds, weights=strengths, minlength=3).tolist()
+        buy_count, sell_count, _ = np.bincount(kinds, minlength=3).tolist()
         
         total = buy_score + sell_score + hold_score
         
@@ -653,13 +1303,13 @@ class TechnicalIndicators:
             return SignalResult(
                 "buy",
                 round(buy_score / total * 100, 1),
-                f"Bullish signals from {sum(1 for s in signals.values() if s.signal == 'buy')} indicators"
+                f"Bullish signals from {buy_count} indicators"
             )
         elif sell_score > buy_score and sell_score > hold_score:
             return SignalResult(
                 "sell",
                 round(sell_score / total * 100, 1),
-                f"Bearish signals from {sum(1 for s in signals.values() if s.signal == 'sell')} indicators"
+                f"Bearish signals from {sell_count} indicators"
             )
         else:
             return SignalResult(
@@ -669,6 +1319,27 @@ class TechnicalIndicators:
             )
 
 
+# Dashboards poll the same symbol many times per bar; results are reused
+# while the input series are unchanged
+ANALYSIS_CACHE_MAX_SIZE = 256
+_analysis_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_key(bars: OHLCV) -> bytes:
+    """Digest of every provided price/volume array plus the last timestamp."""
+    digest = hashlib.blake2b(digest_size=16)
+    for arr in (bars.close, bars.high, bars.low, bars.volume):
+        if arr is None:
+            digest.update(b"\x00")
+        else:
+            digest.update(arr.size.to_bytes(8, "little"))
+            digest.update(arr)
+    if len(bars.index):
+        digest.update(repr(bars.index[-1]).encode())
+    return digest.digest()
+
+
 # Convenience function for quick analysis
 def analyze_stock(
     close: pd.Series,
@@ -679,6 +1350,10 @@ def analyze_stock(
     """
     Perform comprehensive technical analysis on a stock.
     
+    Results are memoized on the input values, so repeated calls for an
+    unchanged series are served from an LRU cache. Each call returns its
+    own copy, which callers may modify freely.
+    
     Args:
         close: Closing prices
         high: High prices (optional)
@@ -688,20 +1363,58 @@ def analyze_stock(
     Returns:
         Dict with all calculated indicators and signals
     """
+    bars = OHLCV.from_series(close, high, low, volume)
+    key = _analysis_key(bars)
+    
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    
+    result = _analyze_bars(bars, close, high, low, volume)
+    
+    with _analysis_cache_lock:
+        _analysis_cache[key] = copy.deepcopy(result)
+        while len(_analysis_cache) > ANALYSIS_CACHE_MAX_SIZE:
+            _analysis_cache.popitem(last=False)
+    return result
+
+
+def _analyze_bars(
+    bars: OHLCV,
+    close: pd.Series,
+    high: Optional[pd.Series],
+    low: Optional[pd.Series],
+    volume: Optional[pd.Series]
+) -> Dict:
+    """Uncached body of analyze_stock."""
     ti = TechnicalIndicators
     
+    # Each indicator is computed once, from the already prepared arrays,
+    # and shared with signal generation
+    rsi = ti.calculate_rsi_soa(bars)
+    macd = ti.calculate_macd_soa(bars)
+    # The 20 period SMA doubles as the Bollinger middle band and trend baseline
+    sma_20, std_20 = _rolling_mean_std_np(bars.close, 20)
+    sma_20 = pd.Series(sma_20, index=bars.index)
+    smas = {'sma_20': sma_20, **ti.calculate_sma_soa(bars, [50, 200])}
+    bollinger = ti.calculate_bollinger_bands_from(sma_20, std_20, bars.close)
+    trend = ti.identify_trend(close, sma=sma_20)
+    
     result = {
-        'rsi': ti.calculate_rsi(close).iloc[-1],
-        'macd': {k: v.iloc[-1] for k, v in ti.calculate_macd(close).items()},
-        'sma': {k: v.iloc[-1] for k, v in ti.calculate_sma(close).items()},
-        'ema': {k: v.iloc[-1] for k, v in ti.calculate_ema(close).items()},
-        'bollinger': {k: v.iloc[-1] for k, v in ti.calculate_bollinger_bands(close).items()},
-        'trend': ti.identify_trend(close),
+        'rsi': rsi.iloc[-1],
+        'macd': {k: v.iloc[-1] for k, v in macd.items()},
+        'sma': {k: v.iloc[-1] for k, v in smas.items()},
+        'ema': {k: v.iloc[-1] for k, v in ti.calculate_ema_soa(bars).items()},
+        'bollinger': {k: v.iloc[-1] for k, v in bollinger.items()},
+        'trend': trend,
     }
     
     if high is not None and low is not None:
-        result['stochastic'] = {k: v.iloc[-1] for k, v in ti.calculate_stochastic(high, low, close).items()}
-        result['atr'] = ti.calculate_atr(high, low, close).iloc[-1]
+        result['stochastic'] = {k: v.iloc[-1] for k, v in ti.calculate_stochastic_soa(bars).items()}
+        result['atr'] = ti.calculate_atr_soa(bars).iloc[-1]
         
         if len(close) > 0:
             result['pivot_points'] = ti.calculate_pivot_points(
@@ -709,14 +1422,48 @@ def analyze_stock(
             )
     
     if volume is not None:
-        result['obv'] = ti.calculate_obv(close, volume).iloc[-1]
+        result['obv'] = ti.calculate_obv_soa(bars).iloc[-1]
         if high is not None and low is not None:
-            result['vwap'] = ti.calculate_vwap(high, low, close, volume).iloc[-1]
+            result['vwap'] = ti.calculate_vwap_soa(bars).iloc[-1]
     
     # Generate signals
-    signals = ti.generate_signals(close, high, low, volume)
+    signals = ti.generate_signals_from_precomputed(close, rsi, macd, trend, bollinger, smas)
     result['signals'] = {k: {'signal': v.signal, 'strength': v.strength, 'reason': v.reason} 
                          for k, v in signals.items()}
     result['overall_signal'] = ti.get_overall_signal(signals)
     
     return result
+
+
+# Below this many symbols, worker startup and pickling cost more than the analysis
+PARALLEL_MIN_SYMBOLS = 4
+
+
+def analyze_stocks(frames: Dict[str, pd.DataFrame], n_jobs: int = -1) -> Dict[str, Dict]:
+    """
+    Run analyze_stock over many symbols, in parallel worker processes.
+    
+    Each symbol is independent, so the work is spread across processes with
+    joblib's loky backend. For fewer than PARALLEL_MIN_SYMBOLS symbols (or
+    when joblib is unavailable / n_jobs == 1) a plain serial loop is used,
+    as it is faster than spinning up workers.
+    
+    Args:
+        frames: Symbol to DataFrame with a 'close' column and optional
+            'high', 'low' and 'volume' columns
+        n_jobs: Number of worker processes (-1 for all cores)
+        
+    Returns:
+        Dict of symbol to analyze_stock result
+    """
+    if not JOBLIB_AVAILABLE or n_jobs == 1 or len(frames) < PARALLEL_MIN_SYMBOLS:
+        return {
+            symbol: analyze_stock(f['close'], f.get('high'), f.get('low'), f.get('volume'))
+            for symbol, f in frames.items()
+        }
+    
+    results = Parallel(n_jobs=n_jobs, backend='loky', batch_size='auto')(
+        delayed(analyze_stock)(f['close'], f.get('high'), f.get('low'), f.get('volume'))
+        for f in frames.values()
+    )
+    return dict(zip(frames.keys(), results))
@@ -3,26 +3,39 @@ Pytest configuration and fixtures.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Generator
-from fastapi.testclient import TestClient
+from typing import AsyncGenerator, Callable, Dict
+from httpx import ASGITransport, AsyncClient, Limits
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 from app.main import app
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(config, item) -> Dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop where available (it is not on Windows)."""
+    # A single factory keeps test IDs free of a loop suffix
+    if UVLOOP_AVAILABLE:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
 
 
-@pytest.fixture(scope="module")
-def client() -> Generator[TestClient, None, None]:
-    """Create test client."""
-    with TestClient(app) as c:
-        yield c
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one in-process async client shared by the whole session."""
+    # ASGITransport does not drive lifespan events, so run startup and
+    # shutdown once here rather than letting each request path warm up
+    limits = Limits(max_keepalive_connections=100, max_connections=100, keepalive_expiry=None)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test", limits=limits
+        ) as c:
+            yield c
 
 
 @pytest.fixture
@@ -4,15 +4,29 @@ Comprehensive tests for all FastAPI routes.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 import asyncio
+import numpy as np
+import pandas as pd
+from typing import List
 
-from app.main import app
+from app.routes import analysis
 
 
-# Sync test client
-client = TestClient(app)
+# All tests share the session-scoped async client from conftest, so they
+# must run on the same session-wide event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _bulk_get(client: AsyncClient, urls: List[str], concurrency: int = 16) -> List[Response]:
+    """Issue GETs concurrently, at most `concurrency` in flight, in input order."""
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def _one(url: str) -> Response:
+        async with sem:
+            return await client.get(url)
+    
+    return await asyncio.gather(*(_one(url) for url in urls))
 
 
 # ============== Health Check Tests ==============
@@ -20,18 +34,18 @@ client = TestClient(app)
 class TestHealthEndpoints:
     """Test health check endpoints."""
     
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client: AsyncClient):
         """Test root endpoint returns app info."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert "name" in data
         assert "version" in data
         assert data["name"] == "Stock Prediction Dashboard"
     
-    def test_health_check(self):
+    async def test_health_check(self, client: AsyncClient):
         """Test health check endpoint."""
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] in ["healthy", "degraded"]
@@ -44,30 +58,30 @@ class TestHealthEndpoints:
 class TestStockEndpoints:
     """Test stock-related endpoints."""
     
-    def test_get_stock_quote_valid(self):
+    async def test_get_stock_quote_valid(self, client: AsyncClient):
         """Test getting a valid stock quote."""
-        response = client.get("/api/v1/stocks/RELIANCE")
+        response = await client.get("/api/v1/stocks/RELIANCE")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "data" in data
         assert data["data"]["symbol"] == "RELIANCE"
     
-    def test_get_stock_quote_with_suffix(self):
+    async def test_get_stock_quote_with_suffix(self, client: AsyncClient):
         """Test stock symbol with .NS suffix."""
-        response = client.get("/api/v1/stocks/TCS.NS")
+        response = await client.get("/api/v1/stocks/TCS.NS")
         assert response.status_code == 200
     
-    def test_get_stock_historical(self):
+    async def test_get_stock_historical(self, client: AsyncClient):
         """Test getting historical data."""
-        response = client.get("/api/v1/stocks/INFY/historical?period=1M")
+        response = await client.get("/api/v1/stocks/INFY/historical?period=1M")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
     
-    def test_search_stocks(self):
+    async def test_search_stocks(self, client: AsyncClient):
         """Test stock search functionality."""
-        response = client.get("/api/v1/stocks/search?query=TATA")
+        response = await client.get("/api/v1/stocks/search?query=TATA")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
@@ -78,18 +92,18 @@ class TestStockEndpoints:
 class TestCryptoEndpoints:
     """Test cryptocurrency endpoints."""
     
-    def test_get_crypto_list(self):
+    async def test_get_crypto_list(self, client: AsyncClient):
         """Test getting top cryptocurrencies."""
-        response = client.get("/api/v1/crypto")
+        response = await client.get("/api/v1/crypto")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "data" in data
         assert isinstance(data["data"], list)
     
-    def test_get_crypto_detail(self):
+    async def test_get_crypto_detail(self, client: AsyncClient):
         """Test getting specific crypto details."""
-        response = client.get("/api/v1/crypto/bitcoin")
+        response = await client.get("/api/v1/crypto/bitcoin")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
@@ -100,16 +114,16 @@ class TestCryptoEndpoints:
 class TestCommoditiesEndpoints:
     """Test commodities endpoints."""
     
-    def test_get_commodities_list(self):
+    async def test_get_commodities_list(self, client: AsyncClient):
         """Test getting commodities list."""
-        response = client.get("/api/v1/commodities")
+        response = await client.get("/api/v1/commodities")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
     
-    def test_get_commodity_detail(self):
+    async def test_get_commodity_detail(self, client: AsyncClient):
         """Test getting specific commodity."""
-        response = client.get("/api/v1/commodities/gold")
+        response = await client.get("/api/v1/commodities/gold")
         assert response.status_code == 200
 
 
@@ -118,9 +132,9 @@ class TestCommoditiesEndpoints:
 class TestPredictionEndpoints:
     """Test prediction endpoints."""
     
-    def test_get_prediction(self):
+    async def test_get_prediction(self, client: AsyncClient):
         """Test getting stock prediction (next-day)."""
-        response = client.get("/api/v1/predictions/RELIANCE")
+        response = await client.get("/api/v1/predictions/RELIANCE")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
@@ -128,23 +142,23 @@ class TestPredictionEndpoints:
         # API returns predicted_price for single prediction
         assert "predicted_price" in data["data"]
     
-    def test_get_weekly_prediction(self):
+    async def test_get_weekly_prediction(self, client: AsyncClient):
         """Test getting weekly stock prediction."""
-        response = client.get("/api/v1/predictions/RELIANCE/weekly")
+        response = await client.get("/api/v1/predictions/RELIANCE/weekly")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "data" in data
     
-    def test_prediction_invalid_symbol(self):
+    async def test_prediction_invalid_symbol(self, client: AsyncClient):
         """Test prediction with empty/invalid path."""
         # Empty symbol should return 404 or 422
-        response = client.get("/api/v1/predictions/")
+        response = await client.get("/api/v1/predictions/")
         assert response.status_code in [404, 307]  # 307 is redirect for trailing slash
     
-    def test_get_models_status(self):
+    async def test_get_models_status(self, client: AsyncClient):
         """Test getting ML models status."""
-        response = client.get("/api/v1/predictions/models/status")
+        response = await client.get("/api/v1/predictions/models/status")
         assert response.status_code == 200
 
 
@@ -153,35 +167,51 @@ class TestPredictionEndpoints:
 class TestAnalysisEndpoints:
     """Test technical analysis endpoints."""
     
-    def test_get_technical_indicators(self):
+    async def test_get_technical_indicators(self, client: AsyncClient):
         """Test getting technical indicators."""
-        response = client.get("/api/v1/analysis/RELIANCE/technical")
+        response = await client.get("/api/v1/analysis/RELIANCE/technical")
         assert response.status_code == 200
         data = response.json()
         # Response model returns data directly with indicators key
         assert "indicators" in data
         assert "symbol" in data
     
-    def test_get_signals(self):
+    async def test_get_signals(self, client: AsyncClient):
         """Test getting trading signals."""
-        response = client.get("/api/v1/analysis/TCS/signals")
+        response = await client.get("/api/v1/analysis/TCS/signals")
         assert response.status_code == 200
         data = response.json()
         # SignalResponse returns 'overall' not 'overall_signal'
         assert "overall" in data
         assert "signals" in data
     
-    def test_get_support_resistance(self):
+    async def test_get_support_resistance(self, client: AsyncClient):
         """Test support/resistance levels."""
-        response = client.get("/api/v1/analysis/HDFCBANK/support-resistance")
+        response = await client.get("/api/v1/analysis/HDFCBANK/support-resistance")
         assert response.status_code == 200
         data = response.json()
         assert "support_levels" in data
         assert "resistance_levels" in data
     
-    def test_get_market_status(self):
+    async def test_support_resistance_levels(self, client: AsyncClient, monkeypatch):
+        """Test support/resistance levels are computed from fetched bars."""
+        close = pd.Series(
+            100 + 10 * np.sin(np.arange(63) / 4),
+            index=pd.date_range("2026-01-01", periods=63, freq="B")
+        )
+        bars = pd.DataFrame({"Close": close, "High": close + 1, "Low": close - 1})
+        monkeypatch.setattr(analysis, "fetch_stock_data", lambda symbol, period="6mo": bars)
+        
+        response = await client.get("/api/v1/analysis/SRTEST/support-resistance")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["support_levels"]
+        assert data["resistance_levels"]
+        assert max(data["support_levels"]) < min(data["resistance_levels"])
+    
+    async def test_get_market_status(self, client: AsyncClient):
         """Test market status endpoint."""
-        response = client.get("/api/v1/analysis/market-status")
+        response = await client.get("/api/v1/analysis/market-status")
         assert response.status_code == 200
         data = response.json()
         # MarketStatusResponse returns is_trading not is_open
@@ -194,17 +224,17 @@ class TestAnalysisEndpoints:
 class TestErrorHandling:
     """Test error handling."""
     
-    def test_404_not_found(self):
+    async def test_404_not_found(self, client: AsyncClient):
         """Test 404 response for unknown endpoints."""
-        response = client.get("/api/v1/unknown/endpoint")
+        response = await client.get("/api/v1/unknown/endpoint")
         assert response.status_code == 404
         data = response.json()
         assert data["success"] is False
         assert "error" in data
     
-    def test_validation_error(self):
+    async def test_validation_error(self, client: AsyncClient):
         """Test validation error response."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/predictions",
             json={}  # Missing required fields
         )
@@ -217,16 +247,16 @@ class TestErrorHandling:
 class TestRateLimiting:
     """Test rate limiting functionality."""
     
-    def test_rate_limit_headers(self):
+    async def test_rate_limit_headers(self, client: AsyncClient):
         """Test that rate limit headers are present."""
-        response = client.get("/api/v1/stocks/RELIANCE")
+        response = await client.get("/api/v1/stocks/RELIANCE")
         # Rate limit headers should be present
         assert "X-Request-ID" in response.headers
     
-    def test_multiple_requests(self):
+    async def test_multiple_requests(self, client: AsyncClient):
         """Test multiple rapid requests."""
-        for _ in range(5):
-            response = client.get("/api/v1/health")
+        responses = await _bulk_get(client, ["/api/v1/health"] * 5)
+        for response in responses:
             assert response.status_code == 200
 
 
@@ -235,9 +265,9 @@ class TestRateLimiting:
 class TestCORS:
     """Test CORS configuration."""
     
-    def test_cors_headers(self):
+    async def test_cors_headers(self, client: AsyncClient):
         """Test CORS headers in response."""
-        response = client.options(
+        response = await client.options(
             "/api/v1/health",
             headers={
                 "Origin": "http://localhost:3000",
@@ -253,9 +283,9 @@ class TestCORS:
 class TestWebSocket:
     """Test WebSocket endpoints."""
     
-    def test_websocket_stats(self):
+    async def test_websocket_stats(self, client: AsyncClient):
         """Test WebSocket stats endpoint."""
-        response = client.get("/ws/stats")
+        response = await client.get("/ws/stats")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
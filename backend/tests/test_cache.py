@@ -0,0 +1,95 @@
+"""
+Cache Tests
+Tests for the @cached decorator's coalescing of concurrent misses and the
+CacheManager's Redis/L1 layering.
+"""
+
+import pytest
+import asyncio
+
+from app.utils.cache import CacheManager, cache_manager, cached
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("cancelled", [0, 1], ids=["owner", "waiter"])
+async def test_cancelled_caller_does_not_cancel_shared_result(cancelled):
+    """Cancelling one caller, even the one that started the work, leaves the rest their value."""
+    release = asyncio.Event()
+    calls = 0
+    
+    @cached(f"test_coalesce_cancel_{cancelled}")
+    async def slow_lookup(symbol: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"symbol": symbol, "price": 100.0}
+    
+    tasks = [asyncio.create_task(slow_lookup("RELIANCE")) for _ in range(5)]
+    await asyncio.sleep(0)  # First caller starts the work, the rest wait on it
+    
+    tasks[cancelled].cancel()
+    await asyncio.sleep(0)
+    release.set()
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    assert isinstance(results[cancelled], asyncio.CancelledError)
+    for i, result in enumerate(results):
+        if i != cancelled:
+            assert result == {"symbol": "RELIANCE", "price": 100.0}
+    assert calls == 1
+
+
+async def test_inflight_entry_kept_until_cache_write(monkeypatch):
+    """Callers arriving while the result is being cached still coalesce."""
+    seen_inflight = []
+    original_set = cache_manager.set
+    
+    async def recording_set(key, value, ttl=None):
+        seen_inflight.append(key in cache_manager._inflight)
+        return await original_set(key, value, ttl)
+    
+    monkeypatch.setattr(cache_manager, "set", recording_set)
+    
+    @cached("test_coalesce_window")
+    async def lookup(symbol: str) -> dict:
+        return {"symbol": symbol}
+    
+    assert await lookup("TCS") == {"symbol": "TCS"}
+    assert seen_inflight == [True]
+    assert not cache_manager._inflight
+
+
+class FakeRedis:
+    """Stores what CacheManager writes; counts reads that reach it."""
+    
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+    
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+    
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+async def test_l1_hits_return_independent_copies():
+    """Mutating a cached value must not leak into the next caller's copy."""
+    manager = CacheManager()
+    manager.redis = FakeRedis()
+    manager._redis_available = True
+    
+    await manager.set("quote", {"symbol": "INFY", "history": [1.0, 2.0]})
+    first = await manager.get("quote")
+    first["history"].append(3.0)
+    first["symbol"] = "changed"
+    
+    assert await manager.get("quote") == {"symbol": "INFY", "history": [1.0, 2.0]}
+    assert manager.redis.gets == 0  # Both reads were served by L1
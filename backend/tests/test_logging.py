@@ -0,0 +1,30 @@
+"""
+Logging Tests
+Tests for the JSON serializer behind the structured log renderer.
+"""
+
+import json
+
+import pytest
+import numpy as np
+
+from app.utils import logging as app_logging
+
+
+@pytest.mark.skipif(not app_logging.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_orjson_dumps_keeps_numeric_types():
+    """NumPy scalars and wide integers log as numbers, not strings."""
+    event = {
+        "event": "indicator",
+        "rsi": np.float64(1.5),
+        "volume": np.int64(1200),
+        "big": 2 ** 70,
+        1: "non-str key",
+    }
+    
+    logged = json.loads(app_logging._orjson_dumps(event, default=repr))
+    
+    assert logged["rsi"] == 1.5
+    assert logged["volume"] == 1200
+    assert logged["big"] == 2 ** 70
+    assert logged["1"] == "non-str key"
@@ -0,0 +1,60 @@
+"""
+Market Utils Tests
+Tests for stock search and the compiled max drawdown path.
+"""
+
+import pytest
+import numpy as np
+
+from app.utils import market_utils
+from app.utils.market_utils import MarketUtils
+
+
+@pytest.mark.skipif(not market_utils.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("nan_prefix", [0, 1, 5])
+def test_max_drawdown_kernel_matches_fallback(monkeypatch, seed, nan_prefix):
+    """Kernel and NumPy fallback agree, including on NaN-prefixed input."""
+    rng = np.random.default_rng(seed)
+    prices = 100 + rng.normal(0, 2, 60).cumsum()
+    if seed % 4 == 0:
+        prices = np.maximum.accumulate(prices)  # No drawdown at all
+    if seed % 3 == 0:
+        prices[rng.integers(nan_prefix, 60, 3)] = np.nan
+    prices[:nan_prefix] = np.nan
+    
+    compiled = MarketUtils.calculate_max_drawdown(prices)
+    monkeypatch.setattr(market_utils, "NUMBA_AVAILABLE", False)
+    fallback = MarketUtils.calculate_max_drawdown(prices)
+    
+    assert compiled == fallback
+    assert not np.isnan(prices[compiled['peak_idx']])
+    assert not np.isnan(prices[compiled['trough_idx']])
+
+
+@pytest.mark.skipif(not market_utils.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("size", [1, 2, 10])
+def test_max_drawdown_all_nan(monkeypatch, size):
+    """All-NaN input gives NaN at index 0 on both paths."""
+    prices = np.full(size, np.nan)
+    
+    for numba_enabled in (True, False):
+        monkeypatch.setattr(market_utils, "NUMBA_AVAILABLE", numba_enabled)
+        result = MarketUtils.calculate_max_drawdown(prices)
+        assert np.isnan(result['max_drawdown'])
+        assert (result['peak_idx'], result['trough_idx']) == (0, 0)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("TATA", {"TCS", "TATAMOTORS", "TATASTEEL"}),
+    ("BAJAJ", {"BAJFINANCE", "BAJAJFINSV"}),
+])
+def test_search_stocks_matches_names(query, expected):
+    """Name matches are returned alongside symbol matches, in list order."""
+    symbols = [stock['symbol'] for stock in MarketUtils.search_stocks(query)]
+    
+    assert expected <= set(symbols)
+    assert symbols == [
+        stock['symbol'] for stock in market_utils.TOP_NSE_STOCKS
+        if query in stock['symbol'].upper() or query in stock['name'].upper()
+    ][:10]
@@ -0,0 +1,36 @@
+"""
+Rate Limiter Tests
+Tests for the header-rewriting rate limit middleware.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.utils.rate_limiter import RateLimitMiddleware, _RL_LIMIT_STR
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def limited_response_app(scope, receive, send):
+    """ASGI app whose response already carries a limit header, like the 429 handler's."""
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"x-ratelimit-limit", b"10"),
+            (b"set-cookie", b"a=1"),
+            (b"set-cookie", b"b=2"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def test_rate_limit_header_sent_once():
+    """The middleware replaces an existing limit header rather than duplicating it."""
+    transport = ASGITransport(app=RateLimitMiddleware(limited_response_app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/stocks/RELIANCE")
+    
+    assert response.headers.get_list("x-ratelimit-limit") == [_RL_LIMIT_STR]
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
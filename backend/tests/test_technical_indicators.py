@@ -0,0 +1,142 @@
+"""
+Technical Indicator Tests
+Pins the array cores (compiled and NumPy fallback) to the pandas formulations
+they replace, so a pandas or numba upgrade that changes results shows up here.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from app.utils import technical_indicators as ti
+
+
+BACKENDS = [
+    pytest.param(True, id="numba", marks=pytest.mark.skipif(
+        not ti.NUMBA_AVAILABLE, reason="numba not installed"
+    )),
+    pytest.param(False, id="numpy"),
+]
+KINDS = ["walk", "nan", "flat", "signed"]
+SEEDS = range(5)
+
+
+def make_series(kind: str, seed: int, n: int = 120) -> np.ndarray:
+    """Random price-like series with NaN gaps, flat runs or sign changes."""
+    rng = np.random.default_rng(seed)
+    arr = np.round(100 + rng.normal(0, 1.5, n).cumsum(), 2)
+    if kind == "nan":
+        arr[rng.integers(0, n, 6)] = np.nan
+    elif kind == "flat":
+        for start in rng.integers(0, n - 25, 3):
+            arr[start:start + 20] = arr[start]
+    elif kind == "signed":
+        arr = np.round(rng.normal(0, 1, n), 3)
+        arr[40:60] = -np.abs(arr[40:60])
+        arr[70:90] = np.abs(arr[70:90])
+    return arr
+
+
+def make_bars(kind: str, seed: int):
+    """High/low/close bars built around make_series()."""
+    close = make_series(kind, seed)
+    rng = np.random.default_rng(seed + 100)
+    spread = np.round(np.abs(rng.normal(0, 1, close.size)), 2)
+    if kind == "flat":
+        spread[20:45] = 0.0
+    return close + spread, close - spread, close
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Run the test once through the numba kernels and once through NumPy/pandas."""
+    monkeypatch.setattr(ti, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("window", [1, 3, 14])
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rolling_mean_std_match_pandas(backend, kind, seed, window):
+    arr = make_series(kind, seed)
+    rolling = pd.Series(arr).rolling(window=window)
+
+    np.testing.assert_array_equal(ti._rolling_mean_np(arr, window), rolling.mean().to_numpy())
+    mean, std = ti._rolling_mean_std_np(arr, window)
+    np.testing.assert_array_equal(mean, rolling.mean().to_numpy())
+    np.testing.assert_array_equal(std, rolling.std().to_numpy())
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rsi_matches_pandas(backend, kind, seed):
+    arr = make_series(kind, seed)
+    delta = pd.Series(arr).diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    expected = (100 - (100 / (1 + gain / loss.replace(0, np.nan)))).fillna(50)
+
+    np.testing.assert_array_equal(ti._calculate_rsi_np(arr, 14), expected.to_numpy())
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_macd_matches_pandas(backend, kind, seed):
+    prices = pd.Series(make_series(kind, seed))
+    macd_line = prices.ewm(span=12, adjust=False).mean() - prices.ewm(span=26, adjust=False).mean()
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+
+    # The EMA recursion runs as an IIR filter rather than pandas' loop, so it
+    # agrees to rounding rather than bit for bit
+    macd, signal, histogram = ti._calculate_macd_np(prices.to_numpy(), 12, 26, 9)
+    np.testing.assert_allclose(macd, macd_line.to_numpy(), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(signal, signal_line.to_numpy(), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(histogram, (macd_line - signal_line).to_numpy(), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_adx_matches_pandas(backend, kind, seed):
+    high, low, close = (pd.Series(a) for a in make_bars(kind, seed))
+    tr = pd.concat(
+        [high - low, abs(high - close.shift(1)), abs(low - close.shift(1))], axis=1
+    ).max(axis=1)
+    atr = tr.rolling(window=14).mean()
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0)
+    minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0)
+    plus_di = 100 * (plus_dm.rolling(window=14).mean() / atr)
+    minus_di = 100 * (minus_dm.rolling(window=14).mean() / atr)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di).replace(0, np.nan)
+    adx = dx.rolling(window=14).mean()
+
+    got = ti._calculate_adx_np(high.to_numpy(), low.to_numpy(), close.to_numpy(), 14)
+    for actual, expected in zip(got, (adx, plus_di, minus_di)):
+        np.testing.assert_array_equal(actual, expected.fillna(0).to_numpy())
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_obv_matches_pandas(backend, kind, seed):
+    prices = pd.Series(make_series(kind, seed))
+    volume = pd.Series(np.random.default_rng(seed).integers(1_000, 50_000, prices.size).astype(float))
+    direction = np.sign(prices.diff())
+    direction.iloc[0] = 0
+    expected = (direction * volume).cumsum()
+
+    got = ti._calculate_obv_np(prices.to_numpy(), volume.to_numpy())
+    np.testing.assert_array_equal(got, expected.to_numpy())
+
+
+def test_support_resistance_on_dated_series():
+    """Regression: a date-indexed Series used to raise NotImplementedError."""
+    prices = pd.Series(
+        [5, 4, 3, 4, 5, 6, 7, 6, 5, 4, 2, 4, 5],
+        index=pd.date_range("2026-01-01", periods=13, freq="B"),
+        dtype=float,
+    )
+
+    levels = ti.TechnicalIndicators.find_support_resistance(prices, window=2, num_levels=5)
+
+    assert levels == {'support': [2.0, 3.0], 'resistance': [7.0]}
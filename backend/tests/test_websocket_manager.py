@@ -0,0 +1,47 @@
+"""
+WebSocket Manager Tests
+Tests for subscription bookkeeping in the price stream manager.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.websocket_manager import WebSocketManager
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def connect_client(manager: WebSocketManager, client_id: str) -> AsyncMock:
+    websocket = AsyncMock()
+    await manager.connect(websocket, client_id)
+    return websocket
+
+
+async def test_unknown_symbol_price_dropped_with_last_subscriber():
+    """Demo prices for arbitrary symbols don't outlive their subscribers."""
+    manager = WebSocketManager()
+    await connect_client(manager, "a")
+    await connect_client(manager, "b")
+    await manager.subscribe("a", ["NOTREAL"])
+    await manager.subscribe("b", ["NOTREAL"])
+    price = manager._get_base_price("NOTREAL")
+    
+    await manager.unsubscribe("a", ["NOTREAL"])
+    assert manager._get_base_price("NOTREAL") == price
+    
+    manager.disconnect("b")
+    assert "NOTREAL" not in manager._unknown_prices
+    assert "NOTREAL" not in manager.symbol_subscribers
+
+
+async def test_subscribe_echoes_request_order():
+    """New symbols come back deduplicated, in the order the client sent them."""
+    manager = WebSocketManager()
+    await connect_client(manager, "a")
+    await manager.subscribe("a", ["tcs"])
+    
+    result = await manager.subscribe("a", ["infy", "RELIANCE", "TCS", "Infy", "hdfcbank"])
+    
+    assert result["subscribed"] == ["INFY", "RELIANCE", "HDFCBANK"]
+    assert result["total_subscriptions"] == 4
@@ -5,11 +5,62 @@ Test prediction accuracy against historical data.
 
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+import hashlib
 import json
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, error_model="numpy")
+    def _bt_kernel(predicted, actual, prev, has_prev, initial_capital, position_size, profits):
+        """
+        Direction hits, compounding trade profits and best/worst error rows
+        in one compiled pass over the aligned arrays.
+        
+        Profits are written into `profits` (one slot per has_prev row) using
+        the same operation order as the NumPy path, so results match exactly.
+        Returns (correct, final_capital, best_i, worst_i).
+        """
+        correct = 0
+        cum = 1.0
+        capital = initial_capital
+        trade = 0
+        best_i = -1
+        worst_i = -1
+        best_e = 0.0
+        worst_e = 0.0
+        for i in range(predicted.shape[0]):
+            e = abs(predicted[i] - actual[i])
+            if e == e:
+                if best_i < 0 or e < best_e:
+                    best_e = e
+                    best_i = i
+                if worst_i < 0 or e > worst_e:
+                    worst_e = e
+                    worst_i = i
+            if has_prev[i]:
+                p = prev[i]
+                up = predicted[i] > p
+                if (actual[i] > p) == up:
+                    correct += 1
+                move = actual[i] - p if up else p - actual[i]
+                profits[trade] = capital * position_size / p * move
+                cum *= 1 + position_size * move / p
+                capital = initial_capital * cum
+                trade += 1
+        if worst_i >= 0 and not worst_e > 0:
+            worst_i = -1
+        return correct, capital, best_i, worst_i
+
 
 @dataclass
 class BacktestResult:
@@ -40,8 +91,16 @@ class Backtester:
         results = backtester.backtest_predictions("RELIANCE", predictions, actual_prices)
     """
     
+    # Price-only risk metrics kept per instance, so comparing several
+    # prediction sets against one price series computes them once
+    METRIC_CACHE_MAX_SIZE = 128
+    
+    # Trades listed in a profit/loss report; totals still cover every trade
+    MAX_REPORTED_TRADES = 20
+    
     def __init__(self):
         self.results_history: List[BacktestResult] = []
+        self._metric_cache: "OrderedDict[Tuple[str, bytes], float]" = OrderedDict()
     
     def backtest_predictions(
         self,
@@ -75,44 +134,25 @@ class Backtester:
         if end_date:
             pred_df = pred_df[pred_df['date'] <= end_date]
         
-        # Calculate metrics
-        correct_direction = 0
-        errors = []
-        percentage_errors = []
+        # Calculate metrics over the rows that have an actual price
+        dates, predicted, actual, prev, has_prev = self._align_predictions(pred_df, actual_prices)
+        errors = np.abs(predicted - actual)
+        percentage_errors = (errors / actual) * 100
+        
+        # Direction accuracy, the trading simulation and best/worst rows
+        correct_direction, profits, capital, best_i, worst_i = self._scan_aligned(
+            predicted, actual, prev, has_prev
+        )
+        
+        # Track best/worst
         best_pred = {'error': float('inf'), 'date': None}
         worst_pred = {'error': 0, 'date': None}
+        if best_i >= 0:
+            best_pred = self._prediction_point(dates, predicted, actual, errors, best_i)
+        if worst_i >= 0:
+            worst_pred = self._prediction_point(dates, predicted, actual, errors, worst_i)
         
-        for _, row in pred_df.iterrows():
-            date = row.get('date')
-            predicted = row.get('predicted_price')
-            
-            if date in actual_prices.index:
-                actual = actual_prices[date]
-                error = abs(predicted - actual)
-                pct_error = (error / actual) * 100
-                
-                errors.append(error)
-                percentage_errors.append(pct_error)
-                
-                # Direction accuracy
-                if len(actual_prices) > 1:
-                    prev_idx = actual_prices.index.get_loc(date) - 1
-                    if prev_idx >= 0:
-                        prev_price = actual_prices.iloc[prev_idx]
-                        actual_direction = actual > prev_price
-                        pred_direction = predicted > prev_price
-                        if actual_direction == pred_direction:
-                            correct_direction += 1
-                
-                # Track best/worst
-                if error < best_pred['error']:
-                    best_pred = {'error': round(error, 2), 'date': str(date), 
-                                'predicted': round(predicted, 2), 'actual': round(actual, 2)}
-                if error > worst_pred['error']:
-                    worst_pred = {'error': round(error, 2), 'date': str(date),
-                                 'predicted': round(predicted, 2), 'actual': round(actual, 2)}
-        
-        total_predictions = len(errors)
+        total_predictions = errors.size
         
         if total_predictions == 0:
             return BacktestResult(
@@ -133,14 +173,15 @@ class Backtester:
                 worst_prediction={}
             )
         
-        mae = np.mean(errors)
-        mpe = np.mean(percentage_errors)
+        mae = errors.mean()
+        mpe = percentage_errors.mean()
         direction_accuracy = (correct_direction / max(1, total_predictions - 1)) * 100
         
         # Calculate profit/loss simulation
-        pnl = self.calculate_profit_loss(pred_df, actual_prices)
-        max_dd = self._calculate_max_drawdown(actual_prices)
-        sharpe = self._calculate_sharpe_ratio(actual_prices)
+        pnl = self._profit_loss_summary(dates, predicted, prev, has_prev, profits, capital)
+        prices_key = self._prices_key(actual_prices)
+        max_dd = self._memoized(('max_drawdown', prices_key), self._calculate_max_drawdown, actual_prices)
+        sharpe = self._memoized(('sharpe_ratio', prices_key), self._calculate_sharpe_ratio, actual_prices)
         win_rate = (correct_direction / max(1, total_predictions)) * 100
         
         result = BacktestResult(
@@ -164,6 +205,52 @@ class Backtester:
         self.results_history.append(result)
         return result
     
+    @staticmethod
+    def _align_predictions(
+        pred_df: pd.DataFrame,
+        actual_prices: pd.Series
+    ) -> Tuple[pd.Series, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Match prediction rows to actual prices by date in one vectorized lookup.
+        
+        Returns:
+            Tuple of (dates, predicted, actual, prev, has_prev) for the rows whose
+            date exists in actual_prices, in prediction order. prev is the prior
+            actual close and has_prev marks rows that have one.
+        """
+        positions = actual_prices.index.get_indexer(pred_df['date'])
+        keep = positions >= 0
+        positions = positions[keep]
+        
+        values = actual_prices.to_numpy(dtype=float)
+        has_prev = positions > 0
+        prev = np.full(positions.size, np.nan)
+        prev[has_prev] = values[positions[has_prev] - 1]
+        
+        return (
+            pred_df['date'][keep],
+            pred_df['predicted_price'].to_numpy(dtype=float)[keep],
+            values[positions],
+            prev,
+            has_prev
+        )
+    
+    @staticmethod
+    def _prediction_point(
+        dates: pd.Series,
+        predicted: np.ndarray,
+        actual: np.ndarray,
+        errors: np.ndarray,
+        i: int
+    ) -> Dict:
+        """Summary of one aligned prediction for the best/worst report."""
+        return {
+            'error': round(errors[i], 2),
+            'date': str(dates.iloc[i]),
+            'predicted': round(predicted[i], 2),
+            'actual': round(actual[i], 2)
+        }
+    
     def calculate_profit_loss(
         self,
         predictions: pd.DataFrame,
@@ -183,58 +270,126 @@ class Backtester:
         Returns:
             Dict with profit/loss metrics
         """
-        capital = initial_capital
-        trades = []
+        dates, predicted, actual, prev, has_prev = self._align_predictions(predictions, actual_prices)
+        _, profits, capital, _, _ = self._scan_aligned(
+            predicted, actual, prev, has_prev, initial_capital, position_size
+        )
+        return self._profit_loss_summary(dates, predicted, prev, has_prev, profits, capital, initial_capital)
+    
+    @staticmethod
+    def _scan_aligned(
+        predicted: np.ndarray,
+        actual: np.ndarray,
+        prev: np.ndarray,
+        has_prev: np.ndarray,
+        initial_capital: float = 100000,
+        position_size: float = 0.1
+    ) -> Tuple[int, np.ndarray, float, int, int]:
+        """
+        Single pass over arrays produced by _align_predictions.
         
-        for i, row in predictions.iterrows():
-            date = row.get('date')
-            predicted = row.get('predicted_price')
-            
-            if date in actual_prices.index:
-                actual = actual_prices[date]
-                prev_idx = actual_prices.index.get_loc(date) - 1
-                
-                if prev_idx >= 0:
-                    prev_price = actual_prices.iloc[prev_idx]
-                    trade_capital = capital * position_size
-                    
-                    # Simple strategy: buy if predicted up, sell if predicted down
-                    if predicted > prev_price:
-                        # Buy signal
-                        shares = trade_capital / prev_price
-                        profit = shares * (actual - prev_price)
-                    else:
-                        # Sell signal (short)
-                        shares = trade_capital / prev_price
-                        profit = shares * (prev_price - actual)
-                    
-                    capital += profit
-                    trades.append({
-                        'date': str(date),
-                        'signal': 'buy' if predicted > prev_price else 'sell',
-                        'profit': round(profit, 2)
-                    })
+        Returns:
+            Tuple of (correct_direction, profits, final_capital, best_i, worst_i).
+            profits has one entry per trade (rows with a previous close);
+            best_i/worst_i are -1 when there is no such row.
+        """
+        if NUMBA_AVAILABLE:
+            profits = np.empty(int(has_prev.sum()))
+            correct, capital, best_i, worst_i = _bt_kernel(
+                predicted, actual, prev, has_prev, float(initial_capital), float(position_size), profits
+            )
+            return int(correct), profits, capital, int(best_i), int(worst_i)
+        
+        errors = np.abs(predicted - actual)
+        best_i = worst_i = -1
+        if errors.size and not np.isnan(errors).all():
+            best_i = int(np.nanargmin(errors))
+            worst_i = int(np.nanargmax(errors))
+            if not errors[worst_i] > 0:
+                worst_i = -1
+        
+        predicted = predicted[has_prev]
+        actual = actual[has_prev]
+        prev = prev[has_prev]
+        
+        # Simple strategy: buy if predicted up, sell (short) if predicted down
+        signal = predicted > prev
+        correct = int(((actual > prev) == signal).sum())
+        move = np.where(signal, actual - prev, prev - actual)
         
+        # Each trade risks position_size of the capital at that point, so
+        # capital compounds by (1 + position_size * return) per trade
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = 1 + position_size * move / prev
+            capital_path = initial_capital * np.cumprod(growth)
+            capital_before = np.concatenate(([initial_capital], capital_path[:-1]))
+            profits = capital_before * position_size / prev * move
+        capital = capital_path[-1] if capital_path.size else initial_capital
+        
+        return correct, profits, capital, best_i, worst_i
+    
+    def _profit_loss_summary(
+        self,
+        dates: pd.Series,
+        predicted: np.ndarray,
+        prev: np.ndarray,
+        has_prev: np.ndarray,
+        profits: np.ndarray,
+        capital: float,
+        initial_capital: float = 100000
+    ) -> Dict:
+        """Profit/loss report from the trade profits and final capital of _scan_aligned."""
         total_pnl = capital - initial_capital
         pnl_percent = (total_pnl / initial_capital) * 100
-        winning_trades = sum(1 for t in trades if t['profit'] > 0)
+        total_trades = int(profits.size)
+        winning_trades = int((np.round(profits, 2) > 0).sum())
+        
+        trades = [
+            {
+                'date': str(dates.iloc[i]),
+                'signal': 'buy' if predicted[i] > prev[i] else 'sell',
+                'profit': round(profits[k], 2)
+            }
+            for k, i in enumerate(np.flatnonzero(has_prev)[:self.MAX_REPORTED_TRADES])
+        ]
         
         return {
             'initial_capital': initial_capital,
             'final_capital': round(capital, 2),
             'profit_loss': round(total_pnl, 2),
             'profit_loss_percent': round(pnl_percent, 2),
-            'total_trades': len(trades),
+            'total_trades': total_trades,
             'winning_trades': winning_trades,
-            'win_rate': round((winning_trades / max(1, len(trades))) * 100, 2),
-            'trades': trades[:20]  # Return first 20 trades
+            'win_rate': round((winning_trades / max(1, total_trades)) * 100, 2),
+            'trades': trades
         }
     
+    @staticmethod
+    def _prices_key(prices: pd.Series) -> bytes:
+        """Digest of the price values, used to key cached metrics."""
+        return hashlib.blake2b(prices.to_numpy(dtype=float).tobytes(), digest_size=16).digest()
+    
+    def _memoized(self, key: Tuple[str, bytes], compute: Callable[[pd.Series], float], prices: pd.Series) -> float:
+        """Return compute(prices), reusing the value cached under key."""
+        if key in self._metric_cache:
+            self._metric_cache.move_to_end(key)
+            return self._metric_cache[key]
+        
+        value = compute(prices)
+        self._metric_cache[key] = value
+        while len(self._metric_cache) > self.METRIC_CACHE_MAX_SIZE:
+            self._metric_cache.popitem(last=False)
+        return value
+    
     def _calculate_max_drawdown(self, prices: pd.Series) -> float:
         """Calculate maximum drawdown percentage."""
-        running_max = prices.expanding().max()
-        drawdown = (prices - running_max) / running_max * 100
-        return abs(drawdown.min())
+        arr = prices.to_numpy(dtype=float)
+        # fmax skips missing prices like expanding().max() does
+        running_max = np.fmax.accumulate(arr)
+        drawdown = (arr - running_max) / running_max * 100
+        if np.isnan(drawdown).all():
+            return float('nan')
+        return abs(float(np.nanmin(drawdown)))
     
     def _calculate_sharpe_ratio(
         self, 
@@ -344,12 +499,14 @@ class Backtester:
         """
         chart_data = []
         
-        for _, row in predictions.iterrows():
-            date = row.get('date')
-            predicted = row.get('predicted_price')
-            
-            if date in actual_prices.index:
-                actual = actual_prices[date]
+        # Resolve every date to its position once, then index the raw values
+        positions = actual_prices.index.get_indexer(predictions['date'])
+        keep = positions >= 0
+        values = actual_prices.to_numpy()
+        
+        for date, predicted, pos in zip(predictions['date'], predictions['predicted_price'], positions):
+            if pos >= 0:
+                actual = values[pos]
                 chart_data.append({
                     'date': str(date),
                     'actual': round(actual, 2),
@@ -357,12 +514,20 @@ class Backtester:
                     'error': round(abs(predicted - actual), 2)
                 })
         
+        # Correlate over the same date-matched pairs, skipping missing values
+        # the way Series.corr does
+        actual = values[positions[keep]].astype(float)
+        predicted = predictions['predicted_price'].to_numpy(dtype=float)[keep]
+        valid = ~(np.isnan(actual) | np.isnan(predicted))
+        correlation = 0
+        if valid.sum() > 1:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlation = float(np.corrcoef(actual[valid], predicted[valid])[0, 1])
+        
         return {
             'chart_data': chart_data,
             'metrics': {
-                'correlation': predictions['predicted_price'].corr(
-                    actual_prices.reindex(predictions['date'])
-                ) if len(predictions) > 1 else 0
+                'correlation': correlation
             }
         }
 